@@ -98,13 +98,13 @@ class ResponseBuilder:
     @staticmethod
     def build_trace_response(trace_id: str) -> TraceResponse:
         """Build a full trace audit response."""
-        # Get event chain from ledger
-        event_chain = ledger.get_all_entries()
+        # Get this trace's events from the ledger index
+        trace_events = ledger.get_trace_entries(trace_id)
 
-        # Filter events for this trace_id
-        trace_events = [
-            event for event in event_chain
-            if event.get("signed_event", {}).get("trace_id") == trace_id
+        # Compact Merkle proofs against one root instead of a full-chain verify
+        tree_size = ledger.get_chain_length()
+        inclusion_proofs = [
+            ledger.get_inclusion_proof(event["index"], tree_size) for event in trace_events
         ]
 
         # Build agent routing tree
@@ -131,7 +131,10 @@ class ResponseBuilder:
             rl_reward_snapshot=rl_reward_snapshot,
             context_fingerprint=context_fingerprint,
             nonce_verification=nonce_verification,
-            signature_verification=signature_verification
+            signature_verification=signature_verification,
+            merkle_root=ledger.get_merkle_root(tree_size)["root"],
+            tree_size=tree_size,
+            inclusion_proofs=inclusion_proofs
         )
 
     @staticmethod
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import asyncio
 from api.schemas import (
-    QueryRequest, MultiJurisdictionRequest, ExplainReasoningRequest,
+    JurisdictionHint, QueryRequest, MultiJurisdictionRequest, ExplainReasoningRequest,
     FeedbackRequest, RLSignalRequest, NyayaResponse, MultiJurisdictionResponse,
     ExplainReasoningResponse, FeedbackResponse, RLSignalResponse, TraceResponse
 )
@@ -12,10 +12,12 @@ from sovereign_agents.jurisdiction_router_agent import JurisdictionRouterAgent
 from sovereign_agents.legal_agent import LegalAgent
 from sovereign_agents.constitutional_agent import ConstitutionalAgent
 from jurisdiction_router.router import JurisdictionRouter
+from jurisdiction_router.single_flight import SingleFlight
 from rl_engine.feedback_api import FeedbackAPI
 from provenance_chain.lineage_tracer import tracer
 from provenance_chain.hash_chain_ledger import ledger
 from provenance_chain.event_signer import signer
+from provenance_chain.context_fingerprint import fingerprint_generator
 
 router = APIRouter(prefix="/nyaya", tags=["nyaya"])
 
@@ -31,6 +33,87 @@ agents = {
     "UAE": LegalAgent(agent_id="uae_legal_agent", jurisdiction="UAE")
 }
 
+# Hinted queries and queries the compiled router is this sure about skip JurisdictionRouterAgent
+FAST_PATH_CONFIDENCE = 0.8
+
+HINT_JURISDICTIONS = {
+    JurisdictionHint.INDIA: "IN",
+    JurisdictionHint.UK: "UK",
+    JurisdictionHint.UAE: "UAE"
+}
+
+# Identical queries arriving together share one routing + agent computation
+query_flights = SingleFlight()
+
+def _fast_route(request: QueryRequest) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Resolve jurisdiction synchronously from the hint or the compiled router.
+
+    Returns:
+        (routing_result, likely_jurisdiction); routing_result is None when
+        neither is conclusive and JurisdictionRouterAgent has to decide
+    """
+    if request.jurisdiction_hint is not None:
+        target_jurisdiction = HINT_JURISDICTIONS[request.jurisdiction_hint]
+        confidence, method = 1.0, "jurisdiction_hint"
+    else:
+        target_jurisdiction, confidence = jurisdiction_router.route_query(request.query)
+        if confidence < FAST_PATH_CONFIDENCE:
+            return None, target_jurisdiction
+        method = "pattern_match"
+
+    routing_result = {
+        "query_type": "routing_request",
+        "source_jurisdiction": "GLOBAL",
+        "target_jurisdiction": target_jurisdiction,
+        "target_agent": jurisdiction_router_agent.jurisdiction_map.get(target_jurisdiction, "default_legal_agent"),
+        "confidence": confidence,
+        "routing_method": method
+    }
+    return routing_result, target_jurisdiction
+
+async def _process_with_agent(jurisdiction: str, request: QueryRequest, trace_id: str) -> Optional[Dict[str, Any]]:
+    """Run the LegalAgent for a jurisdiction, or return None if it is not supported."""
+    if jurisdiction not in agents:
+        return None
+    return await agents[jurisdiction].process({
+        "query": request.query,
+        "trace_id": trace_id
+    })
+
+async def _route_and_process(request: QueryRequest, trace_id: str):
+    """
+    Route a query and run the target agent; returns (routing_result, agent_result or None).
+
+    On the fast path the agent runs as soon as jurisdiction is known. Otherwise
+    the agent for the likely jurisdiction is started speculatively while
+    JurisdictionRouterAgent decides, and is replaced if the decision differs.
+    """
+    routing_result, likely_jurisdiction = _fast_route(request)
+    if routing_result is not None:
+        return routing_result, await _process_with_agent(likely_jurisdiction, request, trace_id)
+
+    speculative = asyncio.ensure_future(_process_with_agent(likely_jurisdiction, request, trace_id))
+    try:
+        routing_result = await jurisdiction_router_agent.process({
+            "query": request.query,
+            "jurisdiction_hint": request.jurisdiction_hint,
+            "domain_hint": request.domain_hint
+        })
+    except BaseException:
+        speculative.cancel()
+        await asyncio.gather(speculative, return_exceptions=True)
+        raise
+
+    target_jurisdiction = routing_result["target_jurisdiction"]
+    if target_jurisdiction == likely_jurisdiction:
+        return routing_result, await speculative
+
+    # Retrieve the discarded run's outcome so a failure there is not logged as unhandled
+    speculative.cancel()
+    await asyncio.gather(speculative, return_exceptions=True)
+    return routing_result, await _process_with_agent(target_jurisdiction, request, trace_id)
+
 @router.post("/query", response_model=NyayaResponse)
 async def query_legal(
     request: QueryRequest,
@@ -47,18 +130,24 @@ async def query_legal(
             trace_id
         )
 
-        # Step 1: Call JurisdictionRouterAgent
-        routing_result = await jurisdiction_router_agent.process({
-            "query": request.query,
-            "jurisdiction_hint": request.jurisdiction_hint,
-            "domain_hint": request.domain_hint
-        })
+        # Steps 1-2: Route (fast path or JurisdictionRouterAgent) and run the LegalAgent.
+        # Concurrent requests with the same context fingerprint share this work.
+        flight_key = (
+            fingerprint_generator.generate_fingerprint(
+                request.query,
+                jurisdiction=request.jurisdiction_hint.value if request.jurisdiction_hint else "global"
+            ),
+            request.domain_hint.value if request.domain_hint else None
+        )
+        routing_result, agent_result = await query_flights.run(
+            flight_key,
+            lambda: _route_and_process(request, trace_id)
+        )
+        routing_result = dict(routing_result)
 
         target_jurisdiction = routing_result["target_jurisdiction"]
-        target_agent_id = routing_result["target_agent"]
 
-        # Step 2: Route to appropriate LegalAgent
-        if target_jurisdiction not in agents:
+        if agent_result is None:
             raise HTTPException(
                 status_code=400,
                 detail=ResponseBuilder.build_error_response(
@@ -69,15 +158,14 @@ async def query_legal(
             )
 
         agent = agents[target_jurisdiction]
-        agent_result = await agent.process({
-            "query": request.query,
-            "trace_id": trace_id
-        })
+        agent_result = dict(agent_result)
 
         # Step 3: Collect confidence and build response
         confidence = agent_result.get("confidence", 0.5)
         domain = request.domain_hint or "general"
-        legal_route = [jurisdiction_router_agent.agent_id, agent.agent_id]
+        # Fast-path routing never ran JurisdictionRouterAgent, so name what actually routed
+        routing_hop = routing_result.get("routing_method") or jurisdiction_router_agent.agent_id
+        legal_route = [routing_hop, agent.agent_id]
 
         # Placeholder for provenance chain and reasoning trace
         provenance_chain = []
@@ -224,8 +312,9 @@ async def submit_feedback(
 ):
     """Submit system-level RL feedback."""
     try:
-        # Forward to RL engine
-        feedback_result = feedback_api.receive_feedback({
+        # Forward to RL engine. Recording feedback appends to the provenance ledger,
+        # which blocks until the entry is durable, so run it off the event loop.
+        feedback_result = await asyncio.to_thread(feedback_api.receive_feedback, {
             "trace_id": request.trace_id,
             "score": request.rating,
             "nonce": nonce,
@@ -107,6 +107,9 @@ class TraceResponse(BaseModel):
     context_fingerprint: str
     nonce_verification: bool
     signature_verification: bool
+    merkle_root: Optional[str] = None
+    tree_size: int = 0
+    inclusion_proofs: List[Dict[str, Any]] = []
 
 class RLSignalRequest(BaseModel):
     trace_id: str = Field(..., description="UUID trace identifier")
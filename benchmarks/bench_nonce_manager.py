@@ -0,0 +1,110 @@
+"""
+Benchmark NonceManager.validate_nonce latency as the number of live nonces grows.
+
+Validate should stay flat from a thousand to a million live nonces, and
+concurrent validators should see little lock wait while a sweep runs.
+
+Usage:
+    python benchmarks/bench_nonce_manager.py
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add the project root to the path so we can import from provenance_chain
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from provenance_chain.nonce_manager import NonceManager
+
+
+def bench_validate(live_nonces: int, samples: int = 10000, **manager_kwargs) -> float:
+    """Return mean validate latency in microseconds with live_nonces outstanding."""
+    manager = NonceManager(**manager_kwargs)
+    for _ in range(live_nonces):
+        manager.generate_nonce()
+
+    # Nonces to consume are issued last so they sit behind the whole table
+    probes = [manager.generate_nonce() for _ in range(samples)]
+
+    started = time.perf_counter()
+    for nonce in probes:
+        assert manager.validate_nonce(nonce)
+    elapsed = time.perf_counter() - started
+    return elapsed / samples * 1e6
+
+
+def bench_expire(live_nonces: int) -> float:
+    """Return seconds taken to expire live_nonces nonces in one sweep."""
+    manager = NonceManager()
+    for _ in range(live_nonces):
+        manager.generate_nonce()
+
+    started = time.perf_counter()
+    removed = manager.expire_nonces(time.time() + manager.ttl_seconds + 1)
+    elapsed = time.perf_counter() - started
+    assert removed == live_nonces
+    return elapsed
+
+
+def bench_validate_during_sweep(live_nonces: int, threads: int = 8, per_thread: int = 5000):
+    """Validate from several threads while a full expiry sweep runs; return contention metrics."""
+    manager = NonceManager()
+    for _ in range(live_nonces):
+        manager.generate_nonce()
+    probes = [[manager.generate_nonce() for _ in range(per_thread)] for _ in range(threads)]
+
+    # Age the bulk of the table so the sweep has real work to do
+    for shard in manager.store.shards:
+        for nonce in shard.nonces:
+            shard.nonces[nonce] -= manager.ttl_seconds / 2
+
+    def validator(nonces):
+        for nonce in nonces:
+            manager.validate_nonce(nonce)
+
+    workers = [threading.Thread(target=validator, args=(p,)) for p in probes]
+    sweeper = threading.Thread(target=manager.expire_nonces, args=(time.time() + manager.ttl_seconds / 2 + 1,))
+    started = time.perf_counter()
+    sweeper.start()
+    for worker in workers:
+        worker.start()
+    for worker in workers + [sweeper]:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    return elapsed, manager.get_contention_metrics()
+
+
+def main():
+    print("NonceManager.validate_nonce latency")
+    print(f"{'live nonces':>12}  {'validate (us)':>14}")
+    for live in (1_000, 10_000, 100_000, 1_000_000):
+        print(f"{live:>12,}  {bench_validate(live):>14.2f}")
+
+    print("\nShared SQLite backend (WAL)")
+    print(f"{'live nonces':>12}  {'validate (us)':>14}")
+    for live in (1_000, 100_000):
+        with tempfile.TemporaryDirectory() as tmp:
+            latency = bench_validate(live, samples=2000, backend="sqlite",
+                                     db_path=os.path.join(tmp, "nonces.db"))
+        print(f"{live:>12,}  {latency:>14.2f}")
+
+    print("\nNonceManager.expire_nonces sweep")
+    for live in (100_000, 1_000_000):
+        elapsed = bench_expire(live)
+        print(f"{live:>12,}  {elapsed:>10.3f}s  ({elapsed / live * 1e6:.2f} us/nonce)")
+
+    print("\nConcurrent validate during a sweep (8 threads x 5,000 validations)")
+    elapsed, metrics = bench_validate_during_sweep(500_000)
+    print(f"  wall time:              {elapsed:.3f}s")
+    print(f"  contention ratio:       {metrics['contention_ratio']:.4f}")
+    print(f"  avg contended wait:     {metrics['avg_contended_wait_ms']:.3f} ms")
+    print(f"  max lock wait:          {metrics['max_lock_wait_ms']:.3f} ms")
+    print(f"  max shard size:         {metrics['max_shard_size']:,}")
+
+
+if __name__ == "__main__":
+    main()
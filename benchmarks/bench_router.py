@@ -0,0 +1,62 @@
+"""
+Benchmark JurisdictionRouter.route_query latency as patterns are added.
+
+Routing scans each query once against the compiled matcher, so latency
+should stay flat from the built-in patterns to hundreds of extra keywords.
+route_batch is timed on the same queries for comparison.
+
+Usage:
+    python benchmarks/bench_router.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path so we can import from jurisdiction_router
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from jurisdiction_router.router import JurisdictionRouter
+
+WORDS = ("india delhi mumbai london england scotland dubai sharjah emirate court contract "
+         "employment tax property divorce appeal judgment supreme parliament house of lords").split()
+
+
+def build_queries(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 16))) for _ in range(count)]
+
+
+def bench_route(router: JurisdictionRouter, queries) -> float:
+    """Return mean route_query latency in microseconds."""
+    started = time.perf_counter()
+    for query in queries:
+        router.route_query(query)
+    return (time.perf_counter() - started) / len(queries) * 1e6
+
+
+def bench_batch(router: JurisdictionRouter, queries) -> float:
+    """Return route_batch time per query in microseconds."""
+    started = time.perf_counter()
+    router.route_batch(queries)
+    return (time.perf_counter() - started) / len(queries) * 1e6
+
+
+def main():
+    queries = build_queries(20_000)
+    router = JurisdictionRouter()
+
+    print("JurisdictionRouter.route_query latency")
+    print(f"{'extra patterns':>15}  {'route (us)':>11}  {'batch (us)':>11}")
+    added = 0
+    for target in (0, 100, 500, 1_000):
+        for i in range(added, target):
+            jurisdiction = ("IN", "UK", "UAE")[i % 3]
+            router.add_jurisdiction_pattern(jurisdiction, rf"\b(city{i}|high court of city{i})\b")
+        added = target
+        print(f"{target:>15,}  {bench_route(router, queries):>11.2f}  {bench_batch(router, queries):>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark resident bytes per Section for the db/ corpus.
+
+Compares the original __dict__-backed dataclass layout, the slotted schema
+classes, and compact mode (interned strings plus shared metadata key tables).
+
+Usage:
+    python benchmarks/bench_schema_memory.py
+"""
+import sys
+from dataclasses import dataclass, fields
+from enum import Enum
+from pathlib import Path
+
+# Add the project root to the path so we can import from data_bridge
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from data_bridge.loader import JSONLoader
+from data_bridge.schemas.section import Section
+
+
+@dataclass
+class LegacySection:
+    """Section as it was before __slots__, for comparison"""
+    section_id: str
+    section_number: str
+    text: str
+    act_id: str
+    jurisdiction: object
+    metadata: dict
+
+
+def deep_size(objects) -> int:
+    """Bytes reachable from objects, counting shared objects once."""
+    seen = set()
+    stack = list(objects)
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (Enum, type)):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+        if hasattr(type(obj), "__slots__"):
+            stack.extend(getattr(obj, name) for name in type(obj).__slots__ if hasattr(obj, name))
+    return total
+
+
+def main():
+    sections, _, _ = JSONLoader(input_directory=str(project_root / "db")).load_and_normalize_directory(use_cache=False)
+    legacy = [LegacySection(**{f.name: getattr(s, f.name) for f in fields(Section)}) for s in sections]
+    compact, _, _ = JSONLoader(input_directory=str(project_root / "db"),
+                               compact=True).load_and_normalize_directory(use_cache=False)
+
+    count = len(sections)
+    print(f"Bytes per Section over {count:,} sections in db/")
+    for label, objects in (("dict dataclass", legacy), ("slotted", sections), ("compact", compact)):
+        print(f"  {label:<16} {deep_size(objects) / count:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark JSONValidator.validate_referential_integrity on a synthetic corpus.
+
+The check should scale linearly: 100k sections and 50k cases validate in
+well under a second. The original nested any() scan is timed at a small size
+for comparison, since it is quadratic.
+
+Usage:
+    python benchmarks/bench_validator.py
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path so we can import from data_bridge
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from data_bridge.validator import JSONValidator
+from data_bridge.schemas.section import Section, Jurisdiction
+from data_bridge.schemas.act import Act
+from data_bridge.schemas.case import Case
+
+
+def build_corpus(section_count: int, case_count: int, sections_per_act: int = 100, refs_per_case: int = 3):
+    """Synthetic corpus where 1% of sections and case references dangle."""
+    acts = [Act(f"act_{i}", f"Act {i}", 2000, Jurisdiction.IN, [])
+            for i in range(section_count // sections_per_act)]
+    sections = []
+    for i in range(section_count):
+        act_id = f"act_{i // sections_per_act}" if i % 100 else f"missing_act_{i % 7}"
+        sections.append(Section(f"section_{i}", str(i), "text", act_id, Jurisdiction.IN))
+    cases = []
+    for i in range(case_count):
+        refs = [f"section_{(i * 31 + r) % section_count}" for r in range(refs_per_case)]
+        if i % 100 == 0:
+            refs.append(f"missing_section_{i}")
+        cases.append(Case(f"case_{i}", "Title", "Court", Jurisdiction.IN, [], "Summary", refs))
+    return sections, acts, cases
+
+
+def legacy_referential_integrity(sections, acts, cases) -> int:
+    """The original O(sections x acts + refs x sections) scan; returns the error count."""
+    errors = 0
+    for section in sections:
+        if not any(act.act_id == section.act_id for act in acts):
+            errors += 1
+    for case in cases:
+        for section_id in case.referenced_sections:
+            if not any(section.section_id == section_id for section in sections):
+                errors += 1
+    return errors
+
+
+def bench(section_count: int, case_count: int):
+    sections, acts, cases = build_corpus(section_count, case_count)
+    validator = JSONValidator()
+    started = time.perf_counter()
+    errors = validator.validate_referential_integrity(sections, acts, cases)
+    elapsed = time.perf_counter() - started
+    return elapsed, len(errors), sections, acts, cases
+
+
+def main():
+    print("JSONValidator.validate_referential_integrity")
+    print(f"{'sections':>10}  {'cases':>10}  {'errors':>8}  {'indexed (s)':>12}  {'legacy (s)':>11}")
+    for section_count, case_count in ((2_000, 1_000), (10_000, 5_000), (100_000, 50_000)):
+        elapsed, error_count, sections, acts, cases = bench(section_count, case_count)
+        legacy = "-"
+        if section_count <= 10_000:
+            started = time.perf_counter()
+            assert legacy_referential_integrity(sections, acts, cases) == error_count
+            legacy = f"{time.perf_counter() - started:.3f}"
+        print(f"{section_count:>10,}  {case_count:>10,}  {error_count:>8,}  {elapsed:>12.3f}  {legacy:>11}")
+
+    _, _, sections, acts, cases = bench(100_000, 50_000)
+    dangling = JSONValidator().find_dangling_references(sections, acts, cases)
+    print(f"\nMissing acts: {len(dangling['acts'])}, missing sections: {len(dangling['sections'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Memory-mapped columnar store for normalized Sections
+"""
+import bisect
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterator, List, Optional
+from .schemas.section import Section, Jurisdiction
+
+MAGIC = b"NYSC"
+# Bump whenever the on-disk layout changes
+FORMAT_VERSION = 1
+
+COLUMNS = ("section_id", "section_number", "text", "act_id", "jurisdiction", "metadata")
+
+# magic, version, row count, then (offsets position, blob position) per column
+_HEADER = struct.Struct("<4sII")
+_COLUMN_ENTRY = struct.Struct("<QQ")
+_ALIGN = 8
+
+
+def _encode(section: Section, column: str) -> bytes:
+    if column == "jurisdiction":
+        return section.jurisdiction.value.encode()
+    if column == "metadata":
+        return json.dumps(dict(section.metadata), ensure_ascii=False, separators=(",", ":")).encode()
+    return getattr(section, column).encode()
+
+
+def write_columnar_corpus(sections: List[Section], path: str):
+    """
+    Write sections as one string table per column plus an id-sorted row order.
+
+    Each column is an array of count + 1 uint64 offsets followed by the
+    concatenated UTF-8 values; metadata is stored as compact JSON. The file is
+    written to a temp path and renamed into place.
+    """
+    count = len(sections)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, count))
+            table_pos = f.tell()
+            f.write(b"\0" * (_COLUMN_ENTRY.size * len(COLUMNS) + _ALIGN))
+
+            entries = []
+            for column in COLUMNS:
+                values = [_encode(section, column) for section in sections]
+                offsets = [0]
+                for value in values:
+                    offsets.append(offsets[-1] + len(value))
+                f.write(b"\0" * (-f.tell() % _ALIGN))
+                offsets_pos = f.tell()
+                f.write(struct.pack(f"<{count + 1}Q", *offsets))
+                blob_pos = f.tell()
+                f.write(b"".join(values))
+                entries.append((offsets_pos, blob_pos))
+
+            # Row numbers ordered by section_id, for binary search lookups
+            order = sorted(range(count), key=lambda row: sections[row].section_id)
+            f.write(b"\0" * (-f.tell() % _ALIGN))
+            order_pos = f.tell()
+            f.write(struct.pack(f"<{count}I", *order))
+
+            f.seek(table_pos)
+            for offsets_pos, blob_pos in entries:
+                f.write(_COLUMN_ENTRY.pack(offsets_pos, blob_pos))
+            f.write(struct.pack("<Q", order_pos))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class SectionView:
+    """
+    Read-only Section backed by a ColumnarCorpus row.
+
+    Fields are decoded from the mapped file on first access and cached on the
+    view; metadata JSON is only parsed when metadata is read.
+    """
+
+    __slots__ = ("_corpus", "_row", "_cache")
+
+    def __init__(self, corpus: 'ColumnarCorpus', row: int):
+        self._corpus = corpus
+        self._row = row
+        self._cache: Dict[str, Any] = {}
+
+    def _field(self, column: str) -> Any:
+        if column not in self._cache:
+            self._cache[column] = self._corpus.get_value(column, self._row)
+        return self._cache[column]
+
+    @property
+    def section_id(self) -> str:
+        return self._field("section_id")
+
+    @property
+    def section_number(self) -> str:
+        return self._field("section_number")
+
+    @property
+    def text(self) -> str:
+        return self._field("text")
+
+    @property
+    def act_id(self) -> str:
+        return self._field("act_id")
+
+    @property
+    def jurisdiction(self) -> Jurisdiction:
+        return self._field("jurisdiction")
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self._field("metadata")
+
+    def to_section(self) -> Section:
+        """Materialize a regular Section"""
+        return Section(**{column: self._field(column) for column in COLUMNS})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self.to_section().to_dict()
+
+    def __repr__(self) -> str:
+        return f"SectionView(row={self._row}, section_id={self.section_id!r})"
+
+
+class ColumnarCorpus:
+    """
+    Read-only, memory-mapped view over a file written by write_columnar_corpus.
+
+    - The file is mapped read-only, so processes opening the same corpus share
+      its physical pages through the OS page cache
+    - Offsets are read in place from the mapping; nothing is decoded up front
+    - Lookup by section_id is a binary search over the stored id order
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        magic, version, self.count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported columnar corpus file: {path}")
+
+        self._offsets: Dict[str, memoryview] = {}
+        self._blobs: Dict[str, int] = {}
+        position = _HEADER.size
+        for column in COLUMNS:
+            offsets_pos, blob_pos = _COLUMN_ENTRY.unpack_from(self._map, position)
+            position += _COLUMN_ENTRY.size
+            self._offsets[column] = self._view[offsets_pos:offsets_pos + 8 * (self.count + 1)].cast("Q")
+            self._blobs[column] = blob_pos
+        order_pos, = struct.unpack_from("<Q", self._map, position)
+        self._order = self._view[order_pos:order_pos + 4 * self.count].cast("I")
+
+    def get_value(self, column: str, row: int) -> Any:
+        """Decode a single field"""
+        offsets = self._offsets[column]
+        start = self._blobs[column] + offsets[row]
+        raw = self._map[start:self._blobs[column] + offsets[row + 1]]
+        if column == "metadata":
+            return json.loads(raw)
+        value = raw.decode()
+        return Jurisdiction(value) if column == "jurisdiction" else value
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, row: int) -> SectionView:
+        if row < 0:
+            row += self.count
+        if not 0 <= row < self.count:
+            raise IndexError(row)
+        return SectionView(self, row)
+
+    def __iter__(self) -> Iterator[SectionView]:
+        for row in range(self.count):
+            yield SectionView(self, row)
+
+    def find(self, section_id: str) -> Optional[SectionView]:
+        """Return the view for a section_id, or None"""
+        ids = _SortedIds(self)
+        position = bisect.bisect_left(ids, section_id)
+        if position < self.count and ids[position] == section_id:
+            return SectionView(self, self._order[position])
+        return None
+
+    def close(self):
+        # Exported buffers must be released before the mapping can close
+        for offsets in getattr(self, "_offsets", {}).values():
+            offsets.release()
+        if getattr(self, "_order", None) is not None:
+            self._order.release()
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'ColumnarCorpus':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _SortedIds:
+    """Sequence adapter so bisect can search section_ids in stored order"""
+
+    def __init__(self, corpus: ColumnarCorpus):
+        self.corpus = corpus
+
+    def __len__(self) -> int:
+        return self.corpus.count
+
+    def __getitem__(self, position: int) -> str:
+        return self.corpus.get_value("section_id", self.corpus._order[position])
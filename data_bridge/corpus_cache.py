@@ -0,0 +1,87 @@
+"""
+Compiled corpus snapshot cache for the JSON data bridge
+"""
+import hashlib
+import logging
+import os
+import pickle
+from typing import Dict, Any, List, Optional, Tuple
+from .schemas.section import Section
+from .schemas.act import Act
+from .schemas.case import Case
+
+# Bump whenever normalization logic changes so stale snapshots are not reused
+SNAPSHOT_VERSION = 2
+
+
+class CorpusCache:
+    """
+    Stores the normalized output of a directory load as a single pickled
+    snapshot, keyed by a content hash of every source file.
+
+    - A snapshot is only returned when the source fingerprint matches exactly
+    - Writes are atomic (temp file + rename), so readers never see a partial snapshot
+    - Corrupt or incompatible snapshots are ignored and rebuilt
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def hash_file(file_path: str) -> str:
+        """SHA256 of a file's contents"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def compute_fingerprint(self, file_paths: List[str], root: str) -> str:
+        """Content hash over the sorted set of source files and their relative paths"""
+        digest = hashlib.sha256(f"snapshot-v{SNAPSHOT_VERSION}".encode())
+        for file_path in sorted(file_paths):
+            rel_path = os.path.relpath(file_path, root).replace(os.sep, '/')
+            digest.update(rel_path.encode())
+            digest.update(b'\0')
+            digest.update(self.hash_file(file_path).encode())
+        return digest.hexdigest()
+
+    def load(self, fingerprint: str) -> Optional[Tuple[List[Section], List[Act], List[Case]]]:
+        """Return the cached corpus if the snapshot matches the fingerprint"""
+        if not os.path.exists(self.cache_path):
+            return None
+
+        try:
+            with open(self.cache_path, 'rb') as f:
+                snapshot: Dict[str, Any] = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable corpus snapshot {self.cache_path}: {e}")
+            return None
+
+        if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("fingerprint") != fingerprint:
+            return None
+
+        return snapshot["sections"], snapshot["acts"], snapshot["cases"]
+
+    def save(self, fingerprint: str, sections: List[Section], acts: List[Act], cases: List[Case]):
+        """Atomically write a new snapshot"""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "fingerprint": fingerprint,
+            "sections": sections,
+            "acts": acts,
+            "cases": cases
+        }
+
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_path))
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            self.logger.warning(f"Could not write corpus snapshot {self.cache_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,200 @@
+"""
+Incremental JSON reader for walking large legal datasets without loading the whole document
+"""
+import json
+import re
+from typing import Any, Iterator, List, TextIO
+
+_WHITESPACE = " \t\n\r"
+# A whole string that ends inside the buffer, or a single character that can
+# change nesting depth or open a string that continues past the buffer
+_STRUCTURAL = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|["\[\]{}]', re.DOTALL)
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[,\]}\s]')
+_DECODER = json.JSONDecoder()
+
+
+class JSONStreamReader:
+    """
+    Pull-style reader over a JSON text stream.
+
+    - Reads the underlying file in fixed-size chunks and drops consumed text,
+      so memory is one chunk plus the text of the value being decoded;
+      skipping a value of any size needs only the chunk
+    - iter_object() / iter_array() walk containers one member at a time
+    - read_value() decodes the next value, skip_value() discards it without
+      building Python objects
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = 1 << 16):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Replace the fully consumed buffer with the next chunk"""
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ('' at end of input)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON stream, found '{found or 'end of input'}'")
+        self.pos += 1
+
+    def _consume_value(self, keep: bool) -> str:
+        """
+        Consume the value at the read position, returning its text if keep is set.
+
+        Nesting depth and string/escape state carry across chunks, so the
+        buffer is dropped as soon as it has been scanned; kept text is
+        collected piecewise and joined once.
+        """
+        first = self.peek()
+        if not first:
+            raise ValueError("Unexpected end of JSON stream")
+
+        pieces: List[str] = []
+        start = self.pos
+        pos = self.pos + 1
+        scalar = first not in '"[{'
+        depth = 0 if first == '"' else 1
+        in_string = first == '"'
+        escaped = False
+        while True:
+            buffer = self.buffer
+            end = -1
+            if scalar:
+                match = _SCALAR_END.search(buffer, pos)
+                if match:
+                    end = match.start()
+            else:
+                while True:
+                    if escaped:
+                        if pos >= len(buffer):
+                            break
+                        pos += 1
+                        escaped = False
+                    if in_string:
+                        match = _STRING_SPECIAL.search(buffer, pos)
+                        if not match:
+                            break
+                        pos = match.end()
+                        if match.group() == '\\':
+                            escaped = True
+                            continue
+                        in_string = False
+                        if depth == 0:
+                            end = pos
+                            break
+                        continue
+
+                    match = _STRUCTURAL.search(buffer, pos)
+                    if not match:
+                        break
+                    pos = match.end()
+                    token = match.group()
+                    if token == '"':
+                        in_string = True
+                    elif token in '[{':
+                        depth += 1
+                    elif token in ']}':
+                        depth -= 1
+                        if depth == 0:
+                            end = pos
+                            break
+
+            if end != -1:
+                if keep:
+                    pieces.append(buffer[start:end])
+                self.pos = end
+                return "".join(pieces)
+
+            if keep:
+                pieces.append(buffer[start:])
+            self.pos = len(buffer)
+            if not self._fill():
+                if scalar:
+                    return "".join(pieces)
+                if in_string or escaped:
+                    raise ValueError("Unterminated string in JSON stream")
+                raise ValueError("Unterminated container in JSON stream")
+            start = pos = 0
+
+    def read_value(self) -> Any:
+        """Decode and consume the next value"""
+        first = self.peek()
+        if first:
+            # Decode straight from the buffer when the value ends inside it; a
+            # scalar is only complete once a delimiter follows, since "1." or
+            # "tr" may continue in the next chunk
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                pass
+            else:
+                if first in '"[{' or _SCALAR_END.match(self.buffer, end):
+                    self.pos = end
+                    return value
+        return json.loads(self._consume_value(keep=True))
+
+    def skip_value(self):
+        """Consume the next value without decoding or retaining it"""
+        self._consume_value(keep=False)
+
+    def _iter_members(self, close: str, keyed: bool) -> Iterator[Any]:
+        index = 0
+        if self.peek() == close:
+            self.pos += 1
+            return
+        while True:
+            if keyed:
+                key = self.read_value()
+                if not isinstance(key, str):
+                    raise ValueError("Object keys in JSON stream must be strings")
+                self._expect(':')
+                yield key
+            else:
+                yield index
+                index += 1
+            # The caller has consumed the member value by now
+            separator = self.peek()
+            self.pos += 1
+            if separator == close:
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or '{close}' in JSON stream, found '{separator or 'end of input'}'")
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Yield each key of the object at the read position.
+
+        The caller must consume the member value (read_value, skip_value or a
+        nested iter_*) before advancing the iterator.
+        """
+        self._expect('{')
+        return self._iter_members('}', keyed=True)
+
+    def iter_array(self) -> Iterator[int]:
+        """Yield each index of the array at the read position; consume the element before advancing"""
+        self._expect('[')
+        return self._iter_members(']', keyed=False)
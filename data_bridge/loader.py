@@ -3,19 +3,52 @@ JSON dataset loader and normalizer for legal datasets
 """
 import json
 import os
-from typing import Dict, Any, List, Tuple, Optional, Union
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterator, List, Tuple, Optional, Union
 from pathlib import Path
 import logging
 from .schemas.section import Section, Jurisdiction
 from .schemas.act import Act
 from .schemas.case import Case
-from .validator import JSONValidator
+from .schemas.compact import Interner
+from .validator import JSONValidator, ValidationPipeline
+from .corpus_cache import CorpusCache
+from .json_stream import JSONStreamReader
+
+
+@dataclass
+class CorpusDiff:
+    """Changes produced by an incremental directory reload"""
+    added_sections: List[Section] = field(default_factory=list)
+    removed_sections: List[Section] = field(default_factory=list)
+    changed_sections: List[Section] = field(default_factory=list)
+    added_acts: List[Act] = field(default_factory=list)
+    removed_acts: List[Act] = field(default_factory=list)
+    changed_acts: List[Act] = field(default_factory=list)
+    changed_files: List[str] = field(default_factory=list)
+    
+    def is_empty(self) -> bool:
+        return not self.changed_files
+
+
+def _diff_by_id(old: List[Any], new: List[Any], id_attr: str) -> Tuple[List[Any], List[Any], List[Any]]:
+    """Return (added, removed, changed) objects between two versions of a set of files"""
+    old_by_id = {getattr(obj, id_attr): obj for obj in old}
+    new_by_id = {getattr(obj, id_attr): obj for obj in new}
+    added = [obj for obj_id, obj in new_by_id.items() if obj_id not in old_by_id]
+    removed = [obj for obj_id, obj in old_by_id.items() if obj_id not in new_by_id]
+    changed = [obj for obj_id, obj in new_by_id.items()
+               if obj_id in old_by_id and old_by_id[obj_id] != obj]
+    return added, removed, changed
 
 
 class JSONLoader:
     """
     JSON-specific loader that:
     - Loads JSON files safely (streaming where possible)
+    - Streams sections one at a time from large files via stream_sections()
     - Detects dataset type (section / act / case)
     - Maps non-standard keys to standard schema
     - Assigns jurisdiction explicitly (fallback defaults allowed)
@@ -23,12 +56,24 @@ class JSONLoader:
     - Produces clean, normalized Python dictionaries
     - Supports bulk loading and single-file loading
     - Is idempotent and deterministic
+    - Optionally reuses a compiled corpus snapshot keyed by source content hash
+    - Optionally parses and normalizes files in parallel worker processes
+    - Supports incremental reloads that only re-normalize changed files
+    - Optionally interns repeated strings and metadata keys (compact mode)
     """
     
-    def __init__(self, input_directory: Optional[str] = None):
+    def __init__(self, input_directory: Optional[str] = None, cache_path: Optional[str] = None,
+                 compact: bool = False):
         self.input_directory = input_directory or "db"
         self.validator = JSONValidator()
         self.logger = logging.getLogger(__name__)
+        self.corpus_cache = CorpusCache(cache_path) if cache_path else None
+        # file path -> parse/normalize timings from the most recent load
+        self.file_timings: Dict[str, Dict[str, Any]] = {}
+        # file path -> mtime, size, content hash and normalized output, for reload_directory
+        self.file_states: Dict[str, Dict[str, Any]] = {}
+        # Shared string and metadata key tables when compact mode is on
+        self.interner = Interner() if compact else None
         
     def load_json_file(self, file_path: str) -> Dict[str, Any]:
         """Safely load a JSON file"""
@@ -362,6 +407,88 @@ class JSONLoader:
         
         return sections
     
+    def stream_sections(self, file_path: str, chunk_size: int = 1 << 16) -> Iterator[Section]:
+        """
+        Yield normalized sections from a file one at a time without loading the
+        whole document.
+        
+        Produces the same sections, in the same order, as extract_sections_from_dataset.
+        A first pass skims the top-level keys to pick the section container with
+        the same precedence, holding one chunk at a time and stopping early at
+        "key_sections", which nothing outranks; a second pass decodes one entry
+        at a time.
+        """
+        jurisdiction = self.detect_jurisdiction_from_path(file_path)
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            reader = JSONStreamReader(f, chunk_size)
+            top_level_keys = set()
+            for key in reader.iter_object():
+                top_level_keys.add(key)
+                if key == "key_sections":
+                    break
+                reader.skip_value()
+        
+        container = next((key for key in ("key_sections", "bns_sections", "sections")
+                          if key in top_level_keys), None)
+        if container is None and top_level_keys & {"criminal_law", "civil_law"}:
+            container = "criminal_law"
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            reader = JSONStreamReader(f, chunk_size)
+            for key in reader.iter_object():
+                if container == "criminal_law":
+                    if key in ("criminal_law", "civil_law") and reader.peek() == '{':
+                        yield from self._stream_nested_sections(reader, key, 2, jurisdiction, file_path)
+                    else:
+                        reader.skip_value()
+                elif container is None:
+                    if reader.peek() == '{' and any(section_indicator in key.lower() for section_indicator in
+                                                    ["section", "s.", "sec", "art", "article"]):
+                        yield from self.extract_sections_from_dataset(
+                            {key: reader.read_value()}, jurisdiction, file_path)
+                    else:
+                        reader.skip_value()
+                elif key != container:
+                    reader.skip_value()
+                elif container == "key_sections":
+                    yield from self._stream_nested_sections(reader, key, 2, jurisdiction, file_path)
+                elif container == "bns_sections":
+                    yield from self._stream_nested_sections(reader, key, 1, jurisdiction, file_path)
+                elif reader.peek() == '[':
+                    act_id = f"{jurisdiction.value}_{os.path.basename(file_path).replace('.json', '')}"
+                    for idx in reader.iter_array():
+                        section_data = reader.read_value()
+                        if isinstance(section_data, dict):
+                            yield self.normalize_section(section_data, jurisdiction,
+                                                         original_key=str(idx), act_id=act_id)
+                elif reader.peek() == '{':
+                    yield from self._stream_nested_sections(reader, key, 1, jurisdiction, file_path)
+                else:
+                    reader.skip_value()
+    
+    def _stream_nested_sections(self, reader: JSONStreamReader, container: str, depth: int,
+                                jurisdiction: Jurisdiction, file_path: str,
+                                path: Tuple[str, ...] = ()) -> Iterator[Section]:
+        """
+        Walk `depth` levels of objects under a container key and normalize each
+        leaf entry on its own by wrapping it in a one-entry copy of the original
+        structure, so the mapping rules stay in extract_sections_from_dataset.
+        """
+        for key in reader.iter_object():
+            if len(path) + 1 < depth:
+                if reader.peek() == '{':
+                    yield from self._stream_nested_sections(reader, container, depth, jurisdiction,
+                                                            file_path, path + (key,))
+                else:
+                    reader.skip_value()
+                continue
+        
+            entry: Any = {key: reader.read_value()}
+            for parent in reversed(path):
+                entry = {parent: entry}
+            yield from self.extract_sections_from_dataset({container: entry}, jurisdiction, file_path)
+    
     def extract_acts_from_dataset(self, data: Dict[str, Any], 
                                 jurisdiction: Jurisdiction, 
                                 file_path: str = "") -> List[Act]:
@@ -594,7 +721,9 @@ class JSONLoader:
         self.logger.info(f"Loading and normalizing file: {file_path}")
         
         # Load the JSON file
+        started = time.perf_counter()
         data = self.load_json_file(file_path)
+        parsed = time.perf_counter()
         
         # Detect jurisdiction
         jurisdiction = self.detect_jurisdiction_from_path(file_path)
@@ -618,37 +747,192 @@ class JSONLoader:
         
         cases = self.extract_cases_from_dataset(data, jurisdiction, file_path)
         
+        self.file_timings[file_path] = {
+            "parse_seconds": parsed - started,
+            "normalize_seconds": time.perf_counter() - parsed,
+            "sections": len(sections),
+            "acts": len(acts),
+            "cases": len(cases)
+        }
+        
         return sections, acts, cases
     
-    def load_and_normalize_directory(self, directory_path: Optional[str] = None) -> Tuple[List[Section], List[Act], List[Case]]:
-        """Load and normalize all JSON files in a directory"""
-        directory = directory_path or self.input_directory
-        all_sections = []
-        all_acts = []
-        all_cases = []
-        
-        self.logger.info(f"Loading and normalizing directory: {directory}")
-        
-        # Find all JSON files in the directory
+    def find_json_files(self, directory: str) -> List[str]:
+        """List all JSON files under a directory in a stable (sorted) order"""
         json_files = []
         for root, dirs, files in os.walk(directory):
             for file in files:
                 if file.lower().endswith('.json'):
                     json_files.append(os.path.join(root, file))
+        return sorted(json_files)
+    
+    def load_and_normalize_directory(self, directory_path: Optional[str] = None,
+                                     use_cache: bool = True, parallel: bool = False,
+                                     max_workers: Optional[int] = None,
+                                     validation: Optional[ValidationPipeline] = None) -> Tuple[List[Section], List[Act], List[Case]]:
+        """
+        Load and normalize all JSON files in a directory.
+        
+        With parallel=True files are parsed and normalized in a process pool;
+        results are merged in sorted file order, so output matches a serial load.
+        
+        When a ValidationPipeline is given, each file is validated as soon as it
+        is merged and the pipeline is finished once the directory is loaded.
+        """
+        directory = directory_path or self.input_directory
+        
+        self.logger.info(f"Loading and normalizing directory: {directory}")
+        
+        # Find all JSON files in the directory
+        json_files = self.find_json_files(directory)
+        
+        # Reuse the compiled snapshot when no source file has changed
+        fingerprint = None
+        if use_cache and self.corpus_cache:
+            fingerprint = self.corpus_cache.compute_fingerprint(json_files, directory)
+            cached = self.corpus_cache.load(fingerprint)
+            if cached is not None:
+                self.logger.info(f"Loaded corpus snapshot for {directory}")
+                if validation is not None:
+                    validation.add_file(*cached, path=directory)
+                    validation.finish()
+                return self._compact(*cached)
+        
+        all_sections = []
+        all_acts = []
+        all_cases = []
+        self.file_timings = {}
         
         # Process each JSON file
+        for file_path, (loaded, timing, error) in self._iter_file_results(json_files, parallel, max_workers):
+            if error is not None:
+                self.logger.error(f"Error processing file {file_path}: {error}")
+                continue
+            sections, acts, cases = loaded
+            all_sections.extend(sections)
+            all_acts.extend(acts)
+            all_cases.extend(cases)
+            self.file_timings[file_path] = timing
+            if validation is not None:
+                validation.add_file(sections, acts, cases, path=file_path)
+        
+        if validation is not None:
+            validation.finish()
+        
+        if fingerprint is not None:
+            self.corpus_cache.save(fingerprint, all_sections, all_acts, all_cases)
+        
+        return self._compact(all_sections, all_acts, all_cases)
+    
+    def _iter_file_results(self, json_files: List[str], parallel: bool,
+                           max_workers: Optional[int]) -> Iterator[Tuple[str, Tuple[Any, Any, Any]]]:
+        """Yield (file_path, (results, timing, error)) in sorted file order as files finish loading"""
+        if parallel and len(json_files) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map() yields in submission order, keeping the merge deterministic
+                yield from zip(json_files, executor.map(_load_file_in_worker, json_files))
+        else:
+            for file_path in json_files:
+                yield file_path, self._load_file_safely(file_path)
+    
+    def _compact(self, sections: List[Section], acts: List[Act],
+                 cases: List[Case]) -> Tuple[List[Section], List[Act], List[Case]]:
+        """Intern loaded objects in compact mode; a no-op otherwise"""
+        if self.interner is None:
+            return sections, acts, cases
+        return self.interner.compact_corpus(sections, acts, cases)
+    
+    def _load_file_safely(self, file_path: str) -> Tuple[Optional[Tuple[List[Section], List[Act], List[Case]]],
+                                                          Optional[Dict[str, Any]], Optional[str]]:
+        """Load one file, returning (results, timing, error) instead of raising"""
+        try:
+            loaded = self.load_and_normalize_file(file_path)
+            return loaded, self.file_timings[file_path], None
+        except Exception as e:
+            return None, None, str(e)
+    
+    def reload_directory(self, directory_path: Optional[str] = None) -> CorpusDiff:
+        """
+        Incrementally reload a directory, re-normalizing only files that changed
+        since the previous reload.
+        
+        A file is re-read when its mtime or size moves and re-normalized only if
+        its content hash differs. The first call loads every file and reports
+        everything as added. Use get_loaded_corpus() for the merged result.
+        """
+        directory = directory_path or self.input_directory
+        json_files = self.find_json_files(directory)
+        changed_files = []
+        old_sections, new_sections, old_acts, new_acts = [], [], [], []
+        
         for file_path in json_files:
+            stat = os.stat(file_path)
+            state = self.file_states.get(file_path)
+            if state and state["mtime"] == stat.st_mtime_ns and state["size"] == stat.st_size:
+                continue
+            
+            content_hash = CorpusCache.hash_file(file_path)
+            if state and state["hash"] == content_hash:
+                state["mtime"], state["size"] = stat.st_mtime_ns, stat.st_size
+                continue
+            
             try:
-                sections, acts, cases = self.load_and_normalize_file(file_path)
-                all_sections.extend(sections)
-                all_acts.extend(acts)
-                all_cases.extend(cases)
+                sections, acts, cases = self._compact(*self.load_and_normalize_file(file_path))
             except Exception as e:
-                self.logger.error(f"Error processing file {file_path}: {e}")
+                # Keep serving the previous version of a file that fails to parse
+                self.logger.error(f"Error reloading file {file_path}: {e}")
                 continue
-        
+            
+            if state:
+                old_sections.extend(state["sections"])
+                old_acts.extend(state["acts"])
+            new_sections.extend(sections)
+            new_acts.extend(acts)
+            changed_files.append(file_path)
+            self.file_states[file_path] = {
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "hash": content_hash,
+                "sections": sections,
+                "acts": acts,
+                "cases": cases
+            }
+        
+        current = set(json_files)
+        for file_path in [path for path in self.file_states if path not in current]:
+            state = self.file_states.pop(file_path)
+            old_sections.extend(state["sections"])
+            old_acts.extend(state["acts"])
+            changed_files.append(file_path)
+        
+        # Diff across all touched files at once so an object moving between files is a change
+        diff = CorpusDiff(changed_files=changed_files)
+        diff.added_sections, diff.removed_sections, diff.changed_sections = _diff_by_id(
+            old_sections, new_sections, "section_id")
+        diff.added_acts, diff.removed_acts, diff.changed_acts = _diff_by_id(old_acts, new_acts, "act_id")
+        
+        self.logger.info(f"Reloaded {len(changed_files)} changed file(s) in {directory}")
+        return diff
+    
+    def get_loaded_corpus(self) -> Tuple[List[Section], List[Act], List[Case]]:
+        """Merged corpus as of the last reload_directory call, in sorted file order"""
+        all_sections, all_acts, all_cases = [], [], []
+        for file_path in sorted(self.file_states):
+            state = self.file_states[file_path]
+            all_sections.extend(state["sections"])
+            all_acts.extend(state["acts"])
+            all_cases.extend(state["cases"])
         return all_sections, all_acts, all_cases
     
+    def get_file_timings(self) -> List[Dict[str, Any]]:
+        """Per-file timings from the last load, slowest first"""
+        timings = []
+        for file_path, timing in self.file_timings.items():
+            total = timing["parse_seconds"] + timing["normalize_seconds"]
+            timings.append({"file": file_path, "total_seconds": total, **timing})
+        timings.sort(key=lambda t: t["total_seconds"], reverse=True)
+        return timings
+    
     def get_embedding_ready_text(self, obj: Union[Section, Act, Case]) -> str:
         """Extract clean text fields from normalized objects for embedding"""
         if isinstance(obj, Section):
@@ -698,3 +982,8 @@ class JSONLoader:
         if year_match:
             return int(year_match.group(0))
         return 0
+
+
+def _load_file_in_worker(file_path: str):
+    """Process pool entry point: load one file with a fresh loader"""
+    return JSONLoader()._load_file_safely(file_path)
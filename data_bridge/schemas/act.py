@@ -12,7 +12,7 @@ class Jurisdiction(Enum):
     UAE = "UAE"
 
 
-@dataclass
+@dataclass(slots=True)
 class Act:
     """
     Standard normalized Act object schema:
@@ -42,6 +42,8 @@ class Act:
         """Convert Act object to dictionary with standard schema"""
         result = asdict(self)
         result["jurisdiction"] = self.jurisdiction.value
+        # Compact objects carry a SharedKeyMetadata mapping instead of a dict
+        result["metadata"] = dict(result["metadata"])
         return result
 
     @classmethod
@@ -12,7 +12,7 @@ class Jurisdiction(Enum):
     UAE = "UAE"
 
 
-@dataclass
+@dataclass(slots=True)
 class Case:
     """
     Standard normalized Case object schema:
@@ -48,6 +48,8 @@ class Case:
         """Convert Case object to dictionary with standard schema"""
         result = asdict(self)
         result["jurisdiction"] = self.jurisdiction.value
+        # Compact objects carry a SharedKeyMetadata mapping instead of a dict
+        result["metadata"] = dict(result["metadata"])
         return result
 
     @classmethod
@@ -0,0 +1,101 @@
+"""
+Compact in-memory representation for normalized schema objects
+"""
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Tuple
+from .section import Section
+from .act import Act
+from .case import Case
+
+
+class SharedKeyMetadata(Mapping):
+    """
+    Read-only metadata mapping whose key tuple is shared by every object with
+    the same set of metadata keys, so each object only stores its values.
+    """
+
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, keys: Tuple[str, ...], values: Tuple[Any, ...]):
+        self._keys = keys
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __reduce__(self):
+        # Pickle memoizes the shared key tuple, so sharing survives corpus snapshots
+        return (SharedKeyMetadata, (self._keys, self._values))
+
+
+class Interner:
+    """
+    Deduplicates repeated strings and metadata key sets across a corpus.
+
+    One Interner should be shared by everything loaded into the same process
+    so that act ids, categories and metadata keys exist once in memory.
+    """
+
+    def __init__(self):
+        self.key_tables: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def value(self, value: Any) -> Any:
+        """Intern strings inside a metadata value, keeping its container types"""
+        if isinstance(value, str):
+            return sys.intern(value)
+        if isinstance(value, list):
+            return [self.value(item) for item in value]
+        if isinstance(value, dict):
+            return {sys.intern(key): self.value(item) for key, item in value.items()}
+        return value
+
+    def metadata(self, metadata: Mapping) -> SharedKeyMetadata:
+        keys = tuple(sys.intern(key) for key in metadata)
+        keys = self.key_tables.setdefault(keys, keys)
+        return SharedKeyMetadata(keys, tuple(self.value(item) for item in metadata.values()))
+
+    def compact_section(self, section: Section) -> Section:
+        # Body text is left alone: it is unique per section, so interning it would only grow the intern table
+        section.section_id = sys.intern(section.section_id)
+        section.section_number = sys.intern(section.section_number)
+        section.act_id = sys.intern(section.act_id)
+        section.metadata = self.metadata(section.metadata)
+        return section
+
+    def compact_act(self, act: Act) -> Act:
+        act.act_id = sys.intern(act.act_id)
+        act.act_name = sys.intern(act.act_name)
+        act.sections = [sys.intern(section_id) for section_id in act.sections]
+        act.metadata = self.metadata(act.metadata)
+        return act
+
+    def compact_case(self, case: Case) -> Case:
+        case.case_id = sys.intern(case.case_id)
+        case.court = sys.intern(case.court)
+        case.referenced_sections = [sys.intern(section_id) for section_id in case.referenced_sections]
+        case.metadata = self.metadata(case.metadata)
+        return case
+
+    def compact_corpus(self, sections: List[Section], acts: List[Act],
+                       cases: List[Case]) -> Tuple[List[Section], List[Act], List[Case]]:
+        """Compact a (sections, acts, cases) tuple in place and return it"""
+        for section in sections:
+            self.compact_section(section)
+        for act in acts:
+            self.compact_act(act)
+        for case in cases:
+            self.compact_case(case)
+        return sections, acts, cases
@@ -12,7 +12,7 @@ class Jurisdiction(Enum):
     UAE = "UAE"
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """
     Standard normalized Section object schema:
@@ -40,6 +40,8 @@ class Section:
         """Convert Section object to dictionary with standard schema"""
         result = asdict(self)
         result["jurisdiction"] = self.jurisdiction.value
+        # Compact objects carry a SharedKeyMetadata mapping instead of a dict
+        result["metadata"] = dict(result["metadata"])
         return result
 
     @classmethod
@@ -0,0 +1,109 @@
+"""
+In-memory inverted index with BM25 ranking over normalized Sections
+"""
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from .schemas.section import Section, Jurisdiction
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Metadata fields folded into a section's searchable text
+INDEXED_METADATA_FIELDS = ("punishment", "elements_required", "process_steps", "civil_remedies", "category")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens"""
+    return _TOKEN.findall(text.lower())
+
+
+def _iter_text(value: Any) -> Iterator[str]:
+    """Flatten strings out of nested metadata values"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_text(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_text(item)
+    elif value is not None:
+        yield str(value)
+
+
+class SectionIndex:
+    """
+    BM25 search over section text, section number and selected metadata.
+
+    - Postings map each term to (document, term frequency) pairs
+    - IDF and per-document length normalization are precomputed at build time,
+      so a query only touches the postings of its own terms
+    - Results can be restricted to a single jurisdiction
+    """
+
+    def __init__(self, sections: Iterable[Section], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.sections: List[Section] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+
+        lengths = []
+        for section in sections:
+            doc_id = len(self.sections)
+            tokens = tokenize(self._document_text(section))
+            self.sections.append(section)
+            lengths.append(len(tokens))
+            for term, freq in Counter(tokens).items():
+                self.postings.setdefault(term, []).append((doc_id, freq))
+
+        doc_count = len(self.sections)
+        avg_length = (sum(lengths) / doc_count) if doc_count else 0.0
+        # Denominator term k1 * (1 - b + b * len / avg_len) for each document
+        self.length_norms = [
+            k1 * (1 - b + b * length / avg_length) if avg_length else k1
+            for length in lengths
+        ]
+        self.idf = {
+            term: math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    @classmethod
+    def from_loader_output(cls, loaded: Tuple[List[Section], List[Any], List[Any]], **kwargs) -> 'SectionIndex':
+        """Build from the (sections, acts, cases) tuple returned by JSONLoader.load_and_normalize_directory"""
+        sections, _, _ = loaded
+        return cls(sections, **kwargs)
+
+    @staticmethod
+    def _document_text(section: Section) -> str:
+        parts = [section.section_number, section.text]
+        for field_name in INDEXED_METADATA_FIELDS:
+            parts.extend(_iter_text(section.metadata.get(field_name)))
+        return " ".join(parts)
+
+    def search(self, query: str, top_k: int = 10,
+               jurisdiction: Optional[Union[Jurisdiction, str]] = None) -> List[Tuple[Section, float]]:
+        """Return up to top_k (section, score) pairs, best first"""
+        if isinstance(jurisdiction, str):
+            jurisdiction = Jurisdiction(jurisdiction)
+
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = self.idf[term]
+            for doc_id, freq in docs:
+                if jurisdiction is not None and self.sections[doc_id].jurisdiction != jurisdiction:
+                    continue
+                score = idf * freq * (self.k1 + 1) / (freq + self.length_norms[doc_id])
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        # Ties break on insertion order so results are deterministic
+        best = heapq.nsmallest(top_k, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.sections[doc_id], score) for doc_id, score in best]
+
+    def __len__(self) -> int:
+        return len(self.sections)
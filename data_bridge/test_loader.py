@@ -1,8 +1,13 @@
 """
 Test script for the JSON data bridge
 """
+import json
 import os
+import shutil
 import sys
+import tempfile
+import time
+import tracemalloc
 from pathlib import Path
 
 # Add the project root to the path so we can import from data_bridge
@@ -10,7 +15,13 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from data_bridge.loader import JSONLoader
-from data_bridge.validator import JSONValidator
+from data_bridge.validator import JSONValidator, ValidationPipeline
+from data_bridge.section_index import SectionIndex
+from data_bridge.vector_index import VectorIndex
+from data_bridge.columnar_store import ColumnarCorpus, write_columnar_corpus
+from data_bridge.schemas.section import Section, Jurisdiction
+from data_bridge.schemas.act import Act
+from data_bridge.schemas.case import Case
 
 
 def test_data_bridge():
@@ -121,5 +132,323 @@ def test_data_bridge():
     print(f"  - Embedding texts: {len(embedding_texts)}")
 
 
+
+def test_corpus_cache():
+    """Test that the compiled corpus snapshot is reused until a source file changes"""
+    print("Testing compiled corpus cache...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = os.path.join(tmp, "db")
+        shutil.copytree("db", source_dir)
+        cache_path = os.path.join(tmp, "corpus.snapshot")
+        
+        loader = JSONLoader(input_directory=source_dir, cache_path=cache_path)
+        sections, acts, cases = loader.load_and_normalize_directory()
+        assert os.path.exists(cache_path)
+        
+        cached_sections, cached_acts, _ = loader.load_and_normalize_directory()
+        assert [s.to_dict() for s in cached_sections] == [s.to_dict() for s in sections]
+        assert [a.to_dict() for a in cached_acts] == [a.to_dict() for a in acts]
+        
+        # Changing one dataset must invalidate the snapshot
+        with open(os.path.join(source_dir, "limitation_act.json"), "w") as f:
+            f.write('{"sections": {"1": "Short title"}}')
+        reloaded_sections, _, _ = loader.load_and_normalize_directory()
+        assert len(reloaded_sections) != len(sections)
+        assert any(s.act_id == "IN_limitation_act" and s.text == "Short title" for s in reloaded_sections)
+    
+    print("✓ Corpus cache test completed successfully!")
+
+
+def test_parallel_load():
+    """Test that a process-pool load merges to exactly the serial result"""
+    print("Testing parallel directory load...")
+    
+    loader = JSONLoader(input_directory="db")
+    sections, acts, cases = loader.load_and_normalize_directory()
+    parallel_sections, parallel_acts, parallel_cases = loader.load_and_normalize_directory(parallel=True, max_workers=2)
+    
+    assert [s.to_dict() for s in parallel_sections] == [s.to_dict() for s in sections]
+    assert [a.to_dict() for a in parallel_acts] == [a.to_dict() for a in acts]
+    assert [c.to_dict() for c in parallel_cases] == [c.to_dict() for c in cases]
+    
+    timings = loader.get_file_timings()
+    assert len(timings) == len(loader.find_json_files("db"))
+    assert sum(t["sections"] for t in timings) == len(sections)
+    
+    print("Slowest files:")
+    for timing in timings[:3]:
+        print(f"  {timing['file']}: parse {timing['parse_seconds']:.4f}s, "
+              f"normalize {timing['normalize_seconds']:.4f}s")
+    
+    print("✓ Parallel load test completed successfully!")
+
+
+def test_incremental_reload():
+    """Test that reload_directory only re-normalizes changed files and reports a diff"""
+    print("Testing incremental directory reload...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = os.path.join(tmp, "db")
+        shutil.copytree("db", source_dir)
+        
+        loader = JSONLoader(input_directory=source_dir)
+        initial = loader.reload_directory()
+        assert initial.added_sections and not initial.removed_sections
+        
+        assert loader.reload_directory().is_empty()
+        
+        limitation_path = os.path.join(source_dir, "limitation_act.json")
+        with open(limitation_path, "w") as f:
+            f.write('{"sections": {"1": "Short title"}}')
+        diff = loader.reload_directory()
+        assert diff.changed_files == [limitation_path]
+        assert [s.text for s in diff.added_sections] == ["Short title"]
+        assert [a.act_id for a in diff.changed_acts] == ["IN_limitation_act"]
+        
+        os.remove(limitation_path)
+        diff = loader.reload_directory()
+        assert [s.text for s in diff.removed_sections] == ["Short title"]
+        assert [a.act_id for a in diff.removed_acts] == ["IN_limitation_act"]
+        
+        sections, _, _ = loader.get_loaded_corpus()
+        assert not any(s.act_id == "IN_limitation_act" for s in sections)
+    
+    print("✓ Incremental reload test completed successfully!")
+
+
+def test_stream_sections():
+    """Test that stream_sections yields the same sections as a full load"""
+    print("Testing streaming section extraction...")
+    
+    loader = JSONLoader(input_directory="db")
+    for file_path in loader.find_json_files("db"):
+        sections, _, _ = loader.load_and_normalize_file(file_path)
+        # A tiny chunk size forces values to straddle buffer refills
+        assert list(loader.stream_sections(file_path, chunk_size=7)) == sections, file_path
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, "tricky_act.json")
+        with open(file_path, "w") as f:
+            f.write('{"notes": {"a": "braces } and \\"quotes\\" ]"}, '
+                    '"sections": [{"section": "1", "text": "Say \\"{hi}\\"\\\\"}, 3, {"id": 2}]}')
+        sections, _, _ = loader.load_and_normalize_file(file_path)
+        streamed = loader.stream_sections(file_path, chunk_size=3)
+        assert next(streamed).text == 'Say "{hi}"\\'
+        assert [sections[0]] + list(streamed) == sections
+    
+    print("✓ Streaming extraction test completed successfully!")
+
+
+def test_stream_sections_large_file():
+    """Test that streaming a large file holds a bounded amount of text"""
+    print("Testing streaming extraction memory on a large file...")
+    
+    loader = JSONLoader(input_directory="db")
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, "large_act.json")
+        description = 'Whoever does an act "quoted" [like] {this} ' * 8
+        with open(file_path, "w") as f:
+            json.dump({"version": "1", "bns_sections": {
+                str(i): {"title": f"Section {i}", "description": description, "punishment": "Fine"}
+                for i in range(12000)}}, f, indent=2)
+        file_size = os.path.getsize(file_path)
+        
+        start = time.perf_counter()
+        expected, _, _ = loader.load_and_normalize_file(file_path)
+        full_load = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        streamed = loader.stream_sections(file_path)
+        first = next(streamed)
+        time_to_first = time.perf_counter() - start
+        assert first == expected[0]
+        # Skimming for the container is a linear scan, not a re-copy per chunk
+        assert time_to_first < max(1.0, 5 * full_load), (time_to_first, full_load)
+        
+        tracemalloc.start()
+        try:
+            count = sum(1 for _ in loader.stream_sections(file_path))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert count == len(expected) == 12000
+        assert file_size > 5_000_000
+        assert peak < file_size // 10, (peak, file_size)
+    
+    print("✓ Large file streaming test completed successfully!")
+
+
+def test_section_index():
+    """Test BM25 search over normalized sections"""
+    print("Testing section search index...")
+    
+    loader = JSONLoader(input_directory="db")
+    index = SectionIndex.from_loader_output(loader.load_and_normalize_directory())
+    
+    results = index.search("murder", top_k=5)
+    assert results and len(results) <= 5
+    assert results[0][0].section_id == "IN_ipc_sections_300"
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+    
+    uae_results = index.search("employment contract", top_k=5, jurisdiction="UAE")
+    assert uae_results
+    assert all(section.jurisdiction.value == "UAE" for section, _ in uae_results)
+    
+    assert index.search("zzzunknownterm") == []
+    
+    print("✓ Section index test completed successfully!")
+
+
+def test_vector_index():
+    """Test dense retrieval, persistence and incremental updates of the vector index"""
+    print("Testing vector index...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        source_dir = os.path.join(tmp, "db")
+        shutil.copytree("db", source_dir)
+        index_path = os.path.join(tmp, "vectors.f32")
+        
+        loader = JSONLoader(input_directory=source_dir)
+        index = VectorIndex(index_path, dim=512)
+        with index:
+            index.apply_diff(loader.reload_directory(), loader)
+        assert not index.dirty
+        sections, acts, _ = loader.get_loaded_corpus()
+        # Objects sharing an id collapse into one row
+        assert len(index) == len({s.section_id for s in sections} | {a.act_id for a in acts})
+        
+        murder, theft = index.search(["punishment for murder", "theft of movable property"], top_k=3)
+        assert len(murder) == 3 and len(theft) == 3
+        assert "IN_ipc_sections_302" in [obj_id for obj_id, _ in murder]
+        assert murder[0][1] >= murder[1][1] >= murder[2][1]
+        
+        # Reopening maps the same matrix and embedder state from disk
+        reopened = VectorIndex(index_path)
+        reopened_murder = reopened.search(["punishment for murder"], top_k=3)[0]
+        assert [obj_id for obj_id, _ in reopened_murder] == [obj_id for obj_id, _ in murder]
+        assert all(abs(a - b) < 1e-5 for (_, a), (_, b) in zip(reopened_murder, murder))
+        
+        with open(os.path.join(source_dir, "ipc_sections.json"), "w") as f:
+            f.write('{"key_sections": {"general": {"999": "Unlawful trade in rare orchids"}}}')
+        reopened.apply_diff(loader.reload_directory(), loader)
+        top_id, _ = reopened.search(["rare orchids"], top_k=1)[0][0]
+        assert top_id == "IN_ipc_sections_999"
+        assert "IN_ipc_sections_302" not in [obj_id for obj_id, _ in reopened.search(["murder"], top_k=50)[0]]
+    
+    print("✓ Vector index test completed successfully!")
+
+
+def test_columnar_store():
+    """Test that the columnar corpus round-trips sections through lazy views"""
+    print("Testing columnar corpus store...")
+    
+    loader = JSONLoader(input_directory="db")
+    sections, _, _ = loader.load_and_normalize_directory()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = os.path.join(tmp, "sections.col")
+        write_columnar_corpus(sections, store_path)
+        
+        with ColumnarCorpus(store_path) as corpus:
+            assert len(corpus) == len(sections)
+            assert [view.to_section() for view in corpus] == sections
+            
+            view = corpus.find("IN_ipc_sections_302")
+            assert view.text == "Punishment for murder"
+            assert view.jurisdiction.value == "IN"
+            assert corpus.find("IN_missing_section") is None
+            assert corpus[-1].section_id == sections[-1].section_id
+    
+    print("✓ Columnar store test completed successfully!")
+
+
+def test_compact_mode():
+    """Test that compact mode shares metadata key tables and keeps the dict API"""
+    print("Testing compact schema objects...")
+    
+    sections, acts, _ = JSONLoader(input_directory="db").load_and_normalize_directory()
+    compact_sections, compact_acts, _ = JSONLoader(input_directory="db", compact=True).load_and_normalize_directory()
+    
+    assert [s.to_dict() for s in compact_sections] == [s.to_dict() for s in sections]
+    assert [a.to_dict() for a in compact_acts] == [a.to_dict() for a in acts]
+    assert compact_sections == sections
+    assert not hasattr(sections[0], "__dict__")
+    
+    ipc = [s for s in compact_sections if s.act_id == "IN_ipc_sections"]
+    assert ipc[0].metadata._keys is ipc[1].metadata._keys
+    assert ipc[0].act_id is ipc[1].act_id
+    assert type(ipc[0].to_dict()["metadata"]) is dict
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cached = JSONLoader(input_directory="db", cache_path=os.path.join(tmp, "corpus.pkl"), compact=True)
+        cached.load_and_normalize_directory()
+        assert cached.load_and_normalize_directory()[0] == sections
+    
+    print("✓ Compact mode test completed successfully!")
+
+
+def test_referential_integrity():
+    """Test dangling reference detection and grouping"""
+    print("Testing referential integrity check...")
+    
+    acts = [Act("act_a", "Act A", 2000, Jurisdiction.IN, [])]
+    sections = [
+        Section("s1", "1", "text", "act_a", Jurisdiction.IN),
+        Section("s2", "2", "text", "act_b", Jurisdiction.IN),
+        Section("s3", "3", "text", "act_b", Jurisdiction.IN)
+    ]
+    cases = [Case("c1", "Title", "Court", Jurisdiction.IN, [], "Summary", ["s1", "s9"])]
+    
+    validator = JSONValidator()
+    errors = validator.validate_referential_integrity(sections, acts, cases)
+    assert [e.value for e in errors] == ["act_b", "act_b", "s9"]
+    assert validator.find_dangling_references(sections, acts, cases) == {
+        "acts": {"act_b": ["s2", "s3"]},
+        "sections": {"s9": ["c1"]}
+    }
+    
+    print("✓ Referential integrity test completed successfully!")
+
+
+def test_validation_pipeline():
+    """Test that the fused pipeline matches the separate passes and reports during loading"""
+    print("Testing fused validation pipeline...")
+    
+    loader = JSONLoader(input_directory="db")
+    files_loaded_at_error = []
+    pipeline = ValidationPipeline(on_error=lambda error: files_loaded_at_error.append(len(loader.file_timings)))
+    sections, acts, cases = loader.load_and_normalize_directory(validation=pipeline)
+    
+    validator = JSONValidator()
+    batch_errors = (validator.validate_duplicate_ids(sections, acts, cases) +
+                    validator.validate_referential_integrity(sections, acts, cases))
+    assert sorted(e.message for e in pipeline.errors) == sorted(e.message for e in batch_errors)
+    # Errors surface while later files are still being loaded
+    assert files_loaded_at_error and files_loaded_at_error[0] < len(loader.file_timings)
+    
+    # References may point forward to objects fed later
+    pipeline = ValidationPipeline()
+    pipeline.add_case(Case("c1", "Title", "Court", Jurisdiction.IN, [], "Summary", ["s1", "s2"]))
+    pipeline.add_section(Section("s1", "1", "text", "act_a", Jurisdiction.IN))
+    pipeline.add_act(Act("act_a", "Act A", "1999", Jurisdiction.IN, []))
+    errors = pipeline.finish()
+    assert [(e.error_type, e.value) for e in errors] == [("INVALID_TYPE", "1999"), ("INVALID_REFERENCE", "s2")]
+    
+    print("✓ Validation pipeline test completed successfully!")
+
+
 if __name__ == "__main__":
-    test_data_bridge()
\ No newline at end of file
+    test_data_bridge()
+    test_corpus_cache()
+    test_parallel_load()
+    test_incremental_reload()
+    test_stream_sections()
+    test_stream_sections_large_file()
+    test_section_index()
+    test_vector_index()
+    test_columnar_store()
+    test_compact_mode()
+    test_referential_integrity()
+    test_validation_pipeline()
\ No newline at end of file
@@ -1,9 +1,9 @@
 """
 JSON schema & integrity validator for legal datasets
 """
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Callable, Dict, Any, List, Tuple, Optional, Union
 from dataclasses import dataclass
-from .schemas.section import Section
+from .schemas.section import Section, Jurisdiction
 from .schemas.act import Act
 from .schemas.case import Case
 
@@ -239,12 +239,30 @@ class JSONValidator:
     
     def validate_referential_integrity(self, sections: List[Section], acts: List[Act], cases: List[Case]) -> List[ValidationError]:
         """Validate referential integrity between different objects"""
+        errors, _ = self._scan_references(sections, acts, cases)
+        return errors
+    
+    def find_dangling_references(self, sections: List[Section], acts: List[Act],
+                                 cases: List[Case]) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Group dangling references by their missing target:
+        {"acts": {missing act_id: [section_id]}, "sections": {missing section_id: [case_id]}}
+        """
+        _, dangling = self._scan_references(sections, acts, cases)
+        return dangling
+    
+    def _scan_references(self, sections: List[Section], acts: List[Act],
+                         cases: List[Case]) -> Tuple[List[ValidationError], Dict[str, Dict[str, List[str]]]]:
+        """Single linear pass using id sets; returns errors and references grouped by target"""
         errors = []
+        dangling: Dict[str, Dict[str, List[str]]] = {"acts": {}, "sections": {}}
+        act_ids = {act.act_id for act in acts}
+        section_ids = {section.section_id for section in sections}
         
         # Check that sections reference valid acts
         for section in sections:
-            act_exists = any(act.act_id == section.act_id for act in acts)
-            if not act_exists:
+            if section.act_id not in act_ids:
+                dangling["acts"].setdefault(section.act_id, []).append(section.section_id)
                 errors.append(ValidationError(
                     field="act_id",
                     error_type="INVALID_REFERENCE",
@@ -255,8 +273,8 @@ class JSONValidator:
         # Check that cases reference valid sections
         for case in cases:
             for section_id in case.referenced_sections:
-                section_exists = any(section.section_id == section_id for section in sections)
-                if not section_exists:
+                if section_id not in section_ids:
+                    dangling["sections"].setdefault(section_id, []).append(case.case_id)
                     errors.append(ValidationError(
                         field="referenced_sections",
                         error_type="INVALID_REFERENCE",
@@ -264,7 +282,7 @@ class JSONValidator:
                         value=section_id
                     ))
         
-        return errors
+        return errors, dangling
     
     def validate_duplicate_ids(self, sections: List[Section], acts: List[Act], cases: List[Case]) -> List[ValidationError]:
         """Detect duplicate IDs within each entity type"""
@@ -316,4 +334,127 @@ class JSONValidator:
     
     def get_validation_errors(self) -> List[ValidationError]:
         """Return the list of validation errors from the last validation"""
-        return self.errors.copy()
\ No newline at end of file
+        return self.errors.copy()
+
+
+# Expected attribute types for the field checks in ValidationPipeline
+_FIELD_TYPES = {
+    "section": {"section_id": str, "section_number": str, "text": str, "act_id": str},
+    "act": {"act_id": str, "act_name": str, "year": int, "sections": list},
+    "case": {"case_id": str, "title": str, "court": str, "citations": list,
+             "summary": str, "referenced_sections": list}
+}
+_TYPE_NAMES = {str: "a string", int: "an integer", list: "a list"}
+_JURISDICTIONS = {j.value for j in Jurisdiction}
+
+
+class ValidationPipeline:
+    """
+    Fused, incremental validator for normalized objects.
+
+    Each object is visited once: field types, duplicate ids and references are
+    checked together. Objects can be fed while the loader is still running;
+    field and duplicate errors are reported immediately, and references to
+    objects not seen yet are held until the target arrives or finish() is called.
+    """
+    
+    def __init__(self, on_error: Optional[Callable[[ValidationError], None]] = None):
+        self.on_error = on_error
+        self.errors: List[ValidationError] = []
+        self.seen_ids: Dict[str, set] = {"section": set(), "act": set(), "case": set()}
+        # missing act_id -> sections waiting on it; missing section_id -> cases waiting on it
+        self.pending_acts: Dict[str, List[str]] = {}
+        self.pending_sections: Dict[str, List[str]] = {}
+    
+    def _report(self, error: ValidationError):
+        self.errors.append(error)
+        if self.on_error is not None:
+            self.on_error(error)
+    
+    def _check_fields(self, obj: Union[Section, Act, Case], kind: str, path: str):
+        for field, expected in _FIELD_TYPES[kind].items():
+            value = getattr(obj, field, None)
+            if not isinstance(value, expected):
+                self._report(ValidationError(
+                    field=field,
+                    error_type="INVALID_TYPE",
+                    message=f"{field} must be {_TYPE_NAMES[expected]}",
+                    value=value,
+                    path=path
+                ))
+        
+        jurisdiction = getattr(obj.jurisdiction, "value", obj.jurisdiction)
+        if jurisdiction not in _JURISDICTIONS:
+            self._report(ValidationError(
+                field="jurisdiction",
+                error_type="INVALID_TYPE",
+                message="jurisdiction must be one of: IN, UK, UAE",
+                value=obj.jurisdiction,
+                path=path
+            ))
+    
+    def _check_duplicate(self, obj_id: str, kind: str, path: str) -> bool:
+        """Record an id; report and return False if it was already seen"""
+        seen = self.seen_ids[kind]
+        if obj_id in seen:
+            self._report(ValidationError(
+                field=f"{kind}_id",
+                error_type="DUPLICATE_ID",
+                message=f"Duplicate {kind} ID found: {obj_id}",
+                value=obj_id,
+                path=path
+            ))
+            return False
+        seen.add(obj_id)
+        return True
+    
+    def add_section(self, section: Section, path: str = ""):
+        self._check_fields(section, "section", path)
+        if self._check_duplicate(section.section_id, "section", path):
+            self.pending_sections.pop(section.section_id, None)
+        if section.act_id not in self.seen_ids["act"]:
+            self.pending_acts.setdefault(section.act_id, []).append(section.section_id)
+    
+    def add_act(self, act: Act, path: str = ""):
+        self._check_fields(act, "act", path)
+        if self._check_duplicate(act.act_id, "act", path):
+            self.pending_acts.pop(act.act_id, None)
+    
+    def add_case(self, case: Case, path: str = ""):
+        self._check_fields(case, "case", path)
+        self._check_duplicate(case.case_id, "case", path)
+        for section_id in case.referenced_sections:
+            if section_id not in self.seen_ids["section"]:
+                self.pending_sections.setdefault(section_id, []).append(case.case_id)
+    
+    def add_file(self, sections: List[Section], acts: List[Act], cases: List[Case], path: str = ""):
+        """Feed one file's normalized output"""
+        # Acts first so a file's own sections resolve without a pending entry
+        for act in acts:
+            self.add_act(act, path)
+        for section in sections:
+            self.add_section(section, path)
+        for case in cases:
+            self.add_case(case, path)
+    
+    def finish(self) -> List[ValidationError]:
+        """Report references that never resolved and return every error found"""
+        for act_id, section_ids in self.pending_acts.items():
+            for section_id in section_ids:
+                self._report(ValidationError(
+                    field="act_id",
+                    error_type="INVALID_REFERENCE",
+                    message=f"Section {section_id} references non-existent act {act_id}",
+                    value=act_id
+                ))
+        for section_id, case_ids in self.pending_sections.items():
+            for case_id in case_ids:
+                self._report(ValidationError(
+                    field="referenced_sections",
+                    error_type="INVALID_REFERENCE",
+                    message=f"Case {case_id} references non-existent section {section_id}",
+                    value=section_id
+                ))
+        self.pending_acts = {}
+        self.pending_sections = {}
+        return self.errors.copy()
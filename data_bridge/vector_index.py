@@ -0,0 +1,243 @@
+"""
+Local dense retrieval over embedding-ready text from the JSON data bridge
+"""
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .schemas.section import Section
+from .schemas.act import Act
+from .schemas.case import Case
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Bump whenever the feature hashing changes so stale matrices are not reused
+INDEX_VERSION = 1
+
+
+@lru_cache(maxsize=1 << 16)
+def _hash_feature(feature: str, dim: int) -> Tuple[int, float]:
+    """Stable (bucket, sign) for a feature; Python's hash() is salted per process"""
+    value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+    return value % dim, (1.0 if value >> 63 else -1.0)
+
+
+class HashedTfidfEmbedder:
+    """
+    CPU-only text embedder: unigrams and bigrams are hashed into `dim` signed
+    buckets, weighted by sublinear term frequency and per-bucket IDF, then
+    L2-normalized so a dot product is cosine similarity.
+
+    IDF is fitted once on the initial corpus and kept fixed afterwards, so
+    vectors added later stay comparable with the ones already stored.
+    """
+
+    def __init__(self, dim: int = 1024, idf: Optional[List[float]] = None):
+        self.dim = dim
+        self.idf = np.asarray(idf, dtype=np.float32) if idf is not None else None
+
+    def _features(self, text: str) -> Counter:
+        tokens = _TOKEN.findall(text.lower())
+        features = Counter(tokens)
+        features.update(f"{left} {right}" for left, right in zip(tokens, tokens[1:]))
+        return features
+
+    def fit(self, texts: Iterable[str]):
+        """Compute per-bucket IDF from a corpus"""
+        doc_freq = np.zeros(self.dim, dtype=np.float64)
+        doc_count = 0
+        for text in texts:
+            doc_count += 1
+            buckets = {_hash_feature(feature, self.dim)[0] for feature in self._features(text)}
+            doc_freq[list(buckets)] += 1
+        self.idf = (np.log((1 + doc_count) / (1 + doc_freq)) + 1).astype(np.float32)
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Return a (len(texts), dim) float32 matrix of unit vectors"""
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in self._features(text).items():
+                bucket, sign = _hash_feature(feature, self.dim)
+                vectors[row, bucket] += sign * (1.0 + math.log(count))
+        if self.idf is not None:
+            vectors *= self.idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+
+class VectorIndex:
+    """
+    Dense vector index stored as a memory-mapped float32 matrix.
+
+    - Rows live in `path`; ids, capacity and embedder state live in `path`.json
+    - add() appends new ids and overwrites rows for ids already present
+    - remove() tombstones rows so they never appear in results
+    - search() answers a batch of queries with one matrix product
+    - add() and remove() only touch memory and the mapped rows; save() (or
+      leaving a `with` block) flushes them and writes the metadata once
+    - Metadata writes are atomic (temp file + rename), like CorpusCache snapshots
+    """
+
+    def __init__(self, path: str, dim: int = 1024, embedder: Optional[HashedTfidfEmbedder] = None):
+        self.path = path
+        self.meta_path = f"{path}.json"
+        self.logger = logging.getLogger(__name__)
+        self.ids: List[Optional[str]] = []
+        self.row_by_id: Dict[str, int] = {}
+        self.capacity = 0
+        self.matrix: Optional[np.memmap] = None
+        # Set by add()/remove() until the next save()
+        self.dirty = False
+
+        meta = self._read_meta()
+        if meta is not None:
+            self.embedder = HashedTfidfEmbedder(meta["dim"], meta["idf"])
+            self.ids = meta["ids"]
+            self.row_by_id = {obj_id: row for row, obj_id in enumerate(self.ids) if obj_id is not None}
+            self._open(meta["capacity"])
+        else:
+            self.embedder = embedder or HashedTfidfEmbedder(dim)
+        self.dim = self.embedder.dim
+
+    def _read_meta(self) -> Optional[Dict[str, Any]]:
+        if not (os.path.exists(self.meta_path) and os.path.exists(self.path)):
+            return None
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable vector index metadata {self.meta_path}: {e}")
+            return None
+        if meta.get("version") != INDEX_VERSION:
+            return None
+        return meta
+
+    def _open(self, capacity: int):
+        self.capacity = capacity
+        self.matrix = np.memmap(self.path, dtype=np.float32, mode='r+',
+                                shape=(capacity, self.embedder.dim)) if capacity else None
+
+    def _ensure_capacity(self, rows: int):
+        if rows <= self.capacity:
+            return
+        new_capacity = max(rows, 2 * self.capacity, 1024)
+        if self.matrix is not None:
+            self.matrix.flush()
+            self.matrix = None
+        # Extending the file zero-fills the new rows
+        with open(self.path, 'ab') as f:
+            f.truncate(new_capacity * self.embedder.dim * 4)
+        self._open(new_capacity)
+
+    def add(self, ids: List[str], texts: List[str]):
+        """Embed and store texts, replacing the vectors of ids already indexed"""
+        if not ids:
+            return
+        if self.embedder.idf is None:
+            self.embedder.fit(texts)
+
+        rows = []
+        for obj_id in ids:
+            row = self.row_by_id.get(obj_id)
+            if row is None:
+                row = len(self.ids)
+                self.ids.append(obj_id)
+                self.row_by_id[obj_id] = row
+            rows.append(row)
+
+        self._ensure_capacity(len(self.ids))
+        self.matrix[rows] = self.embedder.embed(texts)
+        self.dirty = True
+
+    def add_objects(self, objects: List[Union[Section, Act, Case]], loader: Any):
+        """Index normalized objects using loader.get_embedding_ready_text"""
+        ids, texts = [], []
+        for obj in objects:
+            text = loader.get_embedding_ready_text(obj)
+            if text.strip():
+                ids.append(self._object_id(obj))
+                texts.append(text)
+        self.add(ids, texts)
+
+    def apply_diff(self, diff: Any, loader: Any):
+        """Patch the index with a CorpusDiff from JSONLoader.reload_directory"""
+        self.remove([self._object_id(obj) for obj in diff.removed_sections + diff.removed_acts])
+        self.add_objects(diff.added_sections + diff.changed_sections +
+                         diff.added_acts + diff.changed_acts, loader)
+
+    @staticmethod
+    def _object_id(obj: Union[Section, Act, Case]) -> str:
+        if isinstance(obj, Section):
+            return obj.section_id
+        if isinstance(obj, Act):
+            return obj.act_id
+        return obj.case_id
+
+    def remove(self, ids: List[str]):
+        """Tombstone rows for ids; their slots are not reused"""
+        rows = [self.row_by_id.pop(obj_id) for obj_id in ids if obj_id in self.row_by_id]
+        if not rows:
+            return
+        for row in rows:
+            self.ids[row] = None
+        self.matrix[rows] = 0.0
+        self.dirty = True
+
+    def search(self, queries: List[str], top_k: int = 10) -> List[List[Tuple[str, float]]]:
+        """Return, for each query, up to top_k (id, cosine similarity) pairs, best first"""
+        if self.matrix is None or not self.row_by_id or top_k <= 0:
+            return [[] for _ in queries]
+
+        count = len(self.ids)
+        scores = self.embedder.embed(queries) @ self.matrix[:count].T
+        live = np.array([obj_id is not None for obj_id in self.ids])
+        scores[:, ~live] = -np.inf
+
+        k = min(top_k, len(self.row_by_id))
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for query_row, candidates in enumerate(top):
+            ordered = candidates[np.argsort(-scores[query_row, candidates], kind='stable')]
+            results.append([(self.ids[row], float(scores[query_row, row])) for row in ordered])
+        return results
+
+    def save(self):
+        """Flush the matrix and atomically rewrite the metadata if anything changed"""
+        if not self.dirty:
+            return
+        if self.matrix is not None:
+            self.matrix.flush()
+        meta = {
+            "version": INDEX_VERSION,
+            "dim": self.embedder.dim,
+            "capacity": self.capacity,
+            "idf": self.embedder.idf.tolist() if self.embedder.idf is not None else None,
+            "ids": self.ids
+        }
+        tmp_path = f"{self.meta_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, self.meta_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.dirty = False
+
+    def __enter__(self) -> "VectorIndex":
+        return self
+
+    def __exit__(self, *exc):
+        self.save()
+
+    def __len__(self) -> int:
+        return len(self.row_by_id)
@@ -1,6 +1,8 @@
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Optional
 import asyncio
+import time
 from jurisdiction_router.resolver_pipeline import ResolverPipeline
+from rl_engine.performance_memory import PerformanceMemory
 
 class FallbackManager:
     """
@@ -8,10 +10,17 @@ class FallbackManager:
     Automatically escalates to alternate jurisdictions if needed.
     """
     
-    def __init__(self, resolver_pipeline: ResolverPipeline, confidence_threshold: float = 0.7):
+    def __init__(self, resolver_pipeline: ResolverPipeline, confidence_threshold: float = 0.7,
+                 hedge_delay: Optional[float] = None,
+                 performance_memory: Optional[PerformanceMemory] = None,
+                 stats_refresh_interval: float = 60.0):
         self.resolver_pipeline = resolver_pipeline
         self.confidence_threshold = confidence_threshold
         
+        # Seconds to wait on a jurisdiction before also launching the next one.
+        # None processes jurisdictions one after another; 0 launches all at once.
+        self.hedge_delay = hedge_delay
+        
         # Fallback jurisdiction priorities (ordered list)
         self.fallback_priorities = {
             "IN": ["UK", "UAE"],
@@ -21,6 +30,16 @@ class FallbackManager:
         
         # Maximum number of fallback attempts
         self.max_fallback_attempts = 2
+        
+        # Adaptive ordering: fallbacks are ranked by cached reward aggregates from
+        # performance memory, refreshed in the background every stats_refresh_interval
+        self.performance_memory = performance_memory
+        self.stats_refresh_interval = stats_refresh_interval
+        self.reward_stats: Dict[str, Dict[str, Dict[str, float]]] = {"agents": {}, "jurisdictions": {}}
+        self.stats_refreshed_at: Optional[float] = None
+        self._stats_refresh_task: Optional[asyncio.Future] = None
+        # Pseudo-count of neutral (0.0) reward mixed into each mean so thin history ranks near neutral
+        self.reward_prior_weight = 5.0
     
     async def process_with_fallback(self, initial_jurisdiction: str, query: str, trace_id: str = None) -> Dict[str, Any]:
         """
@@ -34,6 +53,11 @@ class FallbackManager:
         Returns:
             Final result with processing path
         """
+        self._schedule_stats_refresh()
+        
+        if self.hedge_delay is not None:
+            return await self._process_hedged(initial_jurisdiction, query, trace_id)
+        
         # Try primary jurisdiction
         primary_result = await self.resolver_pipeline.resolve_and_dispatch(
             initial_jurisdiction, query, trace_id
@@ -50,7 +74,7 @@ class FallbackManager:
         processing_path = [initial_jurisdiction]
         
         # Get fallback jurisdictions for the primary one
-        fallback_list = self.fallback_priorities.get(initial_jurisdiction, [])
+        fallback_list = self.get_fallback_order(initial_jurisdiction, query)
         
         # Try up to max_fallback_attempts
         for i, fallback_jurisdiction in enumerate(fallback_list[:self.max_fallback_attempts]):
@@ -77,6 +101,132 @@ class FallbackManager:
         
         return best_result
     
+    async def _process_hedged(self, initial_jurisdiction: str, query: str, trace_id: str = None) -> Dict[str, Any]:
+        """
+        Hedged variant of process_with_fallback.
+        
+        The next jurisdiction in priority order is launched once hedge_delay has
+        passed without an accepted result, or as soon as nothing is left running.
+        The first result meeting the threshold wins and the rest are cancelled;
+        processing_path and fallback_level describe the winner's position in
+        priority order, exactly as in the sequential mode. A jurisdiction whose
+        dispatch raises simply does not win; the error is re-raised only if
+        every launched jurisdiction failed, preferring the primary's error.
+        """
+        candidates = [initial_jurisdiction] + \
+            self.get_fallback_order(initial_jurisdiction, query)[:self.max_fallback_attempts]
+        positions: Dict[asyncio.Task, int] = {}
+        results: Dict[int, Dict[str, Any]] = {}
+        errors: Dict[int, Exception] = {}
+        pending = set()
+        last_launch = 0.0
+        
+        def launch_next():
+            nonlocal last_launch
+            task = asyncio.ensure_future(self.resolver_pipeline.resolve_and_dispatch(
+                candidates[len(positions)], query, trace_id
+            ))
+            positions[task] = len(positions)
+            pending.add(task)
+            last_launch = time.monotonic()
+        
+        try:
+            launch_next()
+            while pending or len(positions) < len(candidates):
+                if len(positions) < len(candidates) and \
+                        (not pending or time.monotonic() - last_launch >= self.hedge_delay):
+                    launch_next()
+                    continue
+                
+                timeout = None
+                if len(positions) < len(candidates):
+                    timeout = max(0.0, last_launch + self.hedge_delay - time.monotonic())
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                # Among results finishing together, prefer the higher-priority jurisdiction
+                for task in sorted(done, key=positions.get):
+                    pending.discard(task)
+                    level = positions[task]
+                    try:
+                        result = task.result()
+                    except Exception as error:
+                        errors[level] = error
+                        continue
+                    results[level] = result
+                    if result["confidence"] >= self.confidence_threshold:
+                        result["processing_path"] = candidates[:level + 1]
+                        result["fallback_used"] = level > 0
+                        if level > 0:
+                            result["fallback_level"] = level
+                        return result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if not results:
+            raise errors[min(errors)]
+        
+        # If no jurisdiction met the threshold, return the best result
+        best_result = self._select_best_result([results[level] for level in sorted(results)])
+        best_result["processing_path"] = candidates
+        best_result["fallback_used"] = True
+        best_result["fallback_level"] = len(candidates) - 1
+        best_result["note"] = "No result met confidence threshold, returning best available"
+        
+        return best_result
+    
+    def get_fallback_order(self, initial_jurisdiction: str, query: str) -> List[str]:
+        """
+        Fallback jurisdictions in the order they should be tried.
+        
+        Without performance memory this is the static priority list. With it,
+        candidates are ranked by the smoothed mean reward of the agent that would
+        handle the query there, falling back to the jurisdiction-wide mean; the
+        static order breaks ties. Only cached aggregates are read here.
+        """
+        fallback_list = self.fallback_priorities.get(initial_jurisdiction, [])
+        if self.performance_memory is None or self.stats_refreshed_at is None:
+            return fallback_list
+        
+        agent_type = self.resolver_pipeline._determine_agent_type(query)
+        
+        def expected_reward(jurisdiction: str) -> float:
+            agent = self.resolver_pipeline._get_agent(jurisdiction, agent_type) or \
+                self.resolver_pipeline._get_agent(jurisdiction, self.resolver_pipeline.default_agent_type)
+            stats = None
+            if agent is not None:
+                stats = self.reward_stats["agents"].get(f"{agent.__class__.__name__}_{jurisdiction}")
+            if stats is None:
+                stats = self.reward_stats["jurisdictions"].get(jurisdiction)
+            if stats is None:
+                return 0.0
+            return stats["total_reward"] / (stats["count"] + self.reward_prior_weight)
+        
+        # sorted() is stable, so equal scores keep the static priority order
+        return sorted(fallback_list, key=expected_reward, reverse=True)
+    
+    def refresh_reward_stats(self):
+        """Reload reward aggregates from performance memory (blocking)"""
+        if self.performance_memory is None:
+            return
+        self.reward_stats = self.performance_memory.get_reward_aggregates()
+        self.stats_refreshed_at = time.monotonic()
+    
+    def _schedule_stats_refresh(self):
+        """Start a background refresh when the cached aggregates are stale"""
+        if self.performance_memory is None:
+            return
+        if self._stats_refresh_task is not None and not self._stats_refresh_task.done():
+            return
+        if self.stats_refreshed_at is not None and \
+                time.monotonic() - self.stats_refreshed_at < self.stats_refresh_interval:
+            return
+        self._stats_refresh_task = asyncio.ensure_future(asyncio.to_thread(self.refresh_reward_stats))
+        # A failed refresh keeps the previous aggregates and is retried on the next request
+        self._stats_refresh_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+    
     def _select_best_result(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Select the best result from a list based on confidence.
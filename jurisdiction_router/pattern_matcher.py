@@ -0,0 +1,71 @@
+import re
+from typing import Dict, List, Set, Tuple
+
+# A pattern of the form \b(word|two words|...)\b: whole-word literal alternatives
+_LITERAL_ALTERNATION = re.compile(r"\\b\((?:\?:)?((?:\w+(?: \w+)*)(?:\|\w+(?: \w+)*)*)\)\\b")
+_WORD_RUN = re.compile(r"\w+")
+
+
+class PatternMatcher:
+    """
+    Matches a query against every registered pattern in a single scan.
+
+    Whole-word literal alternations (the form all built-in patterns take) are
+    compiled into one phrase table keyed by the exact phrase text. A query is
+    scanned once: every span that starts and ends on a word boundary and is no
+    longer than the longest phrase is looked up in the table, so the cost
+    depends on the query length, not on how many phrases are registered.
+    Any other regex is compiled once and searched separately.
+
+    Patterns can only be appended; each add() updates the table in place.
+    """
+
+    def __init__(self):
+        self.labels: List[str] = []
+        # phrase -> ids of patterns containing it
+        self.phrases: Dict[str, Set[int]] = {}
+        self.max_phrase_length = 0
+        self.regex_patterns: List[Tuple[int, re.Pattern]] = []
+
+    def add(self, label: str, pattern: str) -> int:
+        """Register a pattern for a label and return its id"""
+        pattern_id = len(self.labels)
+        self.labels.append(label)
+
+        literal = _LITERAL_ALTERNATION.fullmatch(pattern)
+        if literal is None:
+            self.regex_patterns.append((pattern_id, re.compile(pattern)))
+            return pattern_id
+
+        for phrase in literal.group(1).split("|"):
+            self.phrases.setdefault(phrase, set()).add(pattern_id)
+            self.max_phrase_length = max(self.max_phrase_length, len(phrase))
+        return pattern_id
+
+    def match(self, text: str) -> Set[int]:
+        """Ids of all patterns that match somewhere in text"""
+        matched: Set[int] = set()
+
+        if self.phrases:
+            runs = [(run.start(), run.end()) for run in _WORD_RUN.finditer(text)]
+            for first, (start, _) in enumerate(runs):
+                for _, end in runs[first:]:
+                    if end - start > self.max_phrase_length:
+                        break
+                    pattern_ids = self.phrases.get(text[start:end])
+                    if pattern_ids:
+                        matched |= pattern_ids
+
+        for pattern_id, compiled in self.regex_patterns:
+            if compiled.search(text):
+                matched.add(pattern_id)
+
+        return matched
+
+    def match_counts(self, text: str) -> Dict[str, int]:
+        """Number of distinct matching patterns per label"""
+        counts: Dict[str, int] = {}
+        for pattern_id in self.match(text):
+            label = self.labels[pattern_id]
+            counts[label] = counts.get(label, 0) + 1
+        return counts
@@ -1,17 +1,30 @@
+import copy
 import uuid
 import asyncio
 from typing import Dict, Any, List
 from sovereign_agents.legal_agent import LegalAgent
 from sovereign_agents.constitutional_agent import ConstitutionalAgent
 from events.event_types import EventType
+from provenance_chain.context_fingerprint import fingerprint_generator
+from jurisdiction_router.result_cache import ResultCache
+from jurisdiction_router.single_flight import SingleFlight
 
 class ResolverPipeline:
     """
     Handles agent dispatch and structured result returns.
     Takes jurisdiction result and calls respective agent.
+    
+    Responses are cached by context fingerprint (normalized query,
+    jurisdiction and hour bucket) plus agent type, so a repeated query skips
+    the agent call. Pass cache_size=0 to disable caching. The cache is
+    cleared whenever an agent is registered; call notify_corpus_changed()
+    after reloading the corpus the agents read from.
+    
+    Concurrent misses for the same key share one agent call, and each
+    caller still gets a response carrying its own trace ID.
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 1024, cache_ttl: float = 300.0):
         # Agent registry - maps jurisdictions to agent instances
         self.agent_registry = {
             "IN": {
@@ -30,6 +43,9 @@ class ResolverPipeline:
         
         # Default agent type
         self.default_agent_type = "legal"
+        
+        self.result_cache = ResultCache(max_entries=cache_size, ttl_seconds=cache_ttl)
+        self.in_flight = SingleFlight()
     
     async def resolve_and_dispatch(self, jurisdiction: str, query: str, trace_id: str = None) -> Dict[str, Any]:
         """
@@ -57,6 +73,26 @@ class ResolverPipeline:
         if not agent:
             raise ValueError(f"No agent available for jurisdiction {jurisdiction}")
         
+        cache_key = (fingerprint_generator.generate_fingerprint(query, jurisdiction=jurisdiction), agent_type)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            self._emit_classified(agent, agent_type, jurisdiction, trace_id, "cache")
+            return self._copy_response(cached, trace_id)
+        
+        source = "coalesced" if cache_key in self.in_flight else "agent"
+        generation = self.result_cache.invalidations
+        response = await self.in_flight.run(
+            cache_key,
+            lambda: self._dispatch(agent, jurisdiction, query, trace_id, cache_key, generation)
+        )
+        
+        # Every caller logs its own classification, whether or not it ran the agent
+        self._emit_classified(agent, agent_type, jurisdiction, trace_id, source)
+        return self._copy_response(response, trace_id)
+    
+    async def _dispatch(self, agent, jurisdiction: str, query: str, trace_id: str,
+                        cache_key, generation: int) -> Dict[str, Any]:
+        """Run the agent once and cache its response unless the cache was invalidated meanwhile"""
         # Prepare query for agent
         agent_query = {
             "text": query,
@@ -67,13 +103,6 @@ class ResolverPipeline:
         # Process with agent
         agent_result = await agent.process(agent_query)
         
-        # Log events
-        routing_event = agent.emit_event(EventType.AGENT_CLASSIFIED.value, {
-            "classification": agent_type,
-            "target_agent": agent.__class__.__name__,
-            "jurisdiction": jurisdiction
-        })
-        
         # Build structured response
         response = {
             "jurisdiction": jurisdiction,
@@ -84,8 +113,35 @@ class ResolverPipeline:
             "routing_path": [agent.__class__.__name__]
         }
         
+        if self.result_cache.invalidations == generation:
+            self.result_cache.put(cache_key, response)
         return response
     
+    def _emit_classified(self, agent, agent_type: str, jurisdiction: str, trace_id: str, source: str):
+        """
+        Log the agent classification for one caller's trace.
+        
+        Args:
+            source: "agent" if this caller ran the agent, "coalesced" if it
+                shared another caller's in-flight run, "cache" for a cache hit
+        """
+        return agent.emit_event(EventType.AGENT_CLASSIFIED.value, {
+            "classification": agent_type,
+            "target_agent": agent.__class__.__name__,
+            "jurisdiction": jurisdiction,
+            "trace_id": trace_id,
+            "source": source
+        })
+    
+    @staticmethod
+    def _copy_response(response: Dict[str, Any], trace_id: str) -> Dict[str, Any]:
+        """Copy of a (possibly cached) response carrying the caller's trace ID"""
+        result = dict(response)
+        result["response"] = copy.deepcopy(response["response"])
+        result["routing_path"] = list(response["routing_path"])
+        result["trace_id"] = trace_id
+        return result
+    
     def _determine_agent_type(self, query: str) -> str:
         """
         Determine which type of agent should handle the query.
@@ -137,4 +193,27 @@ class ResolverPipeline:
         if jurisdiction not in self.agent_registry:
             self.agent_registry[jurisdiction] = {}
             
-        self.agent_registry[jurisdiction][agent_type] = agent_instance
\ No newline at end of file
+        self.agent_registry[jurisdiction][agent_type] = agent_instance
+        self.result_cache.invalidate()
+        self.in_flight.forget()
+    
+    def notify_corpus_changed(self, diff=None):
+        """
+        Drop cached responses after the legal corpus has changed.
+        
+        Args:
+            diff: Optional CorpusDiff from JSONLoader.reload_directory; an
+                empty diff leaves the cache intact
+        """
+        if diff is not None and diff.is_empty():
+            return
+        self.result_cache.invalidate()
+        self.in_flight.forget()
+    
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """Hit/miss counters for the response cache and in-flight coalescing"""
+        metrics = self.result_cache.get_metrics()
+        metrics["dispatched"] = self.in_flight.started
+        metrics["coalesced"] = self.in_flight.coalesced
+        metrics["in_flight"] = len(self.in_flight)
+        return metrics
\ No newline at end of file
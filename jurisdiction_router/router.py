@@ -1,5 +1,6 @@
-import re
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List
+import numpy as np
+from jurisdiction_router.pattern_matcher import PatternMatcher
 
 class JurisdictionRouter:
     """
@@ -33,6 +34,21 @@ class JurisdictionRouter:
             "UK": 1.0,
             "UAE": 1.0
         }
+        
+        # All patterns compiled into one matcher; add_jurisdiction_pattern extends it
+        self.recompile()
+    
+    def recompile(self):
+        """
+        Rebuild the compiled matcher from jurisdiction_patterns.
+        
+        add_jurisdiction_pattern keeps the matcher current on its own; call this
+        after editing the jurisdiction_patterns lists directly.
+        """
+        self.matcher = PatternMatcher()
+        for jurisdiction, patterns in self.jurisdiction_patterns.items():
+            for pattern in patterns:
+                self.matcher.add(jurisdiction, pattern)
     
     def route_query(self, query: str, metadata: Dict[Any, Any] = None) -> Tuple[str, float]:
         """
@@ -51,11 +67,9 @@ class JurisdictionRouter:
         # Convert query to lowercase for matching
         query_lower = query.lower()
         
-        # Score each jurisdiction based on pattern matches
-        for jurisdiction, patterns in self.jurisdiction_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, query_lower):
-                    scores[jurisdiction] += self.jurisdiction_weights[jurisdiction]
+        # Score each jurisdiction based on pattern matches, scanning the query once
+        for jurisdiction, matched in self.matcher.match_counts(query_lower).items():
+            scores[jurisdiction] += matched * self.jurisdiction_weights[jurisdiction]
         
         # Find the highest scoring jurisdiction
         best_jurisdiction = max(scores, key=scores.get)
@@ -71,6 +85,51 @@ class JurisdictionRouter:
             
         return best_jurisdiction, confidence
     
+    def route_batch(self, queries: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Route many queries in one call with the same scoring as route_query.
+        
+        Each distinct query is scanned once with the shared compiled matcher;
+        scoring and normalization are done on a (queries x jurisdictions) matrix.
+        
+        Args:
+            queries: Text queries to analyze
+            
+        Returns:
+            Tuple of (jurisdiction labels, confidence scores) as arrays aligned with queries
+        """
+        jurisdictions = list(self.jurisdiction_patterns.keys())
+        column = {jurisdiction: index for index, jurisdiction in enumerate(jurisdictions)}
+        
+        # Distinct queries are matched once; repeated queries share a row
+        rows: Dict[str, int] = {}
+        query_rows = np.empty(len(queries), dtype=np.int64)
+        row_index, column_index, counts = [], [], []
+        for position, query in enumerate(queries):
+            query_lower = query.lower()
+            row = rows.get(query_lower)
+            if row is None:
+                row = rows[query_lower] = len(rows)
+                for jurisdiction, matched in self.matcher.match_counts(query_lower).items():
+                    row_index.append(row)
+                    column_index.append(column[jurisdiction])
+                    counts.append(matched)
+            query_rows[position] = row
+        
+        matches = np.zeros((len(rows), len(jurisdictions)))
+        np.add.at(matches, (np.array(row_index, dtype=np.int64), np.array(column_index, dtype=np.int64)), counts)
+        scores = matches * np.array([self.jurisdiction_weights[j] for j in jurisdictions])
+        
+        # argmax keeps the first jurisdiction on ties, like max() over the scores dict
+        best = scores.argmax(axis=1) if len(jurisdictions) else np.zeros(len(rows), dtype=np.int64)
+        max_scores = scores.max(axis=1, initial=0.0)
+        total_scores = scores.sum(axis=1)
+        unmatched = max_scores == 0
+        
+        labels = np.array(jurisdictions + ["IN"], dtype=object)[np.where(unmatched, len(jurisdictions), best)]
+        confidences = np.where(unmatched, 0.1, max_scores / np.where(total_scores > 0, total_scores, 1.0))
+        return labels[query_rows], confidences[query_rows]
+    
     def add_jurisdiction_pattern(self, jurisdiction: str, pattern: str, weight: float = 1.0):
         """
         Add a new jurisdiction pattern for extensibility.
@@ -86,4 +145,5 @@ class JurisdictionRouter:
         else:
             self.jurisdiction_weights[jurisdiction] = weight
             
-        self.jurisdiction_patterns[jurisdiction].append(pattern)
\ No newline at end of file
+        self.jurisdiction_patterns[jurisdiction].append(pattern)
+        self.matcher.add(jurisdiction, pattern)
\ No newline at end of file
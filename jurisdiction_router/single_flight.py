@@ -0,0 +1,71 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """One in-flight computation and the number of callers awaiting it"""
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one computation.
+
+    The first caller for a key starts the computation; callers arriving
+    while it is still running await the same task instead of starting
+    their own. Once it finishes the key is released, so later calls compute
+    afresh. A caller that is cancelled stops waiting without disturbing the
+    others; the computation itself is cancelled only when no caller is left.
+    """
+
+    def __init__(self):
+        self.calls: Dict[Hashable, _Call] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await compute() for key, sharing it with any concurrent caller.
+
+        Args:
+            key: Identity of the computation
+            compute: Zero-argument coroutine function, only called if no
+                computation for key is in flight
+
+        Returns:
+            The shared result; every caller receives the same object
+        """
+        call = self.calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(compute()))
+            self.calls[key] = call
+            call.task.add_done_callback(lambda _: self._release(key, call))
+            self.started += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def forget(self):
+        """Let new callers start fresh computations; running ones still finish"""
+        self.calls.clear()
+
+    def _release(self, key: Hashable, call: _Call):
+        if self.calls.get(key) is call:
+            del self.calls[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.calls
+
+    def __len__(self) -> int:
+        return len(self.calls)
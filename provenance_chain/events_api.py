@@ -1,7 +1,8 @@
 from fastapi import FastAPI, HTTPException
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .lineage_tracer import tracer
 from .hash_chain_ledger import ledger
+from .nonce_manager import nonce_manager
 
 app = FastAPI(title="Sovereign Provenance Events API")
 
@@ -25,11 +26,33 @@ async def get_recent_traces(limit: int = 10) -> List[Dict[str, Any]]:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/events/verify")
-async def verify_chain_integrity() -> Dict[str, bool]:
-    """Verify the integrity of the entire provenance chain."""
+async def verify_chain_integrity(full: bool = False) -> Dict[str, Any]:
+    """
+    Verify the integrity of the provenance chain.
+    Resumes from the last signed checkpoint; pass full=true for a complete audit.
+    """
     try:
-        is_valid = ledger.verify_chain_integrity()
-        return {"chain_valid": is_valid}
+        return ledger.verify_chain(full=full)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/events/proof/{index}")
+async def get_inclusion_proof(index: int, tree_size: Optional[int] = None) -> Dict[str, Any]:
+    """Get a Merkle inclusion proof for a single ledger entry."""
+    try:
+        return ledger.get_inclusion_proof(index, tree_size)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/events/consistency")
+async def get_consistency_proof(first_size: int, second_size: Optional[int] = None) -> Dict[str, Any]:
+    """Get a Merkle consistency proof between two chain lengths."""
+    try:
+        return ledger.get_consistency_proof(first_size, second_size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -40,11 +63,20 @@ async def get_chain_stats() -> Dict[str, Any]:
         length = ledger.get_chain_length()
         return {
             "chain_length": length,
-            "total_events": length - 1  # Subtract genesis block
+            "total_events": length - 1,  # Subtract genesis block
+            "commit": ledger.get_commit_stats()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/events/nonces")
+async def get_nonce_metrics() -> Dict[str, Any]:
+    """Get nonce table occupancy and lock contention metrics."""
+    try:
+        return nonce_manager.get_contention_metrics()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
@@ -2,34 +2,125 @@ import hashlib
 import json
 import os
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
 import threading
+import time
+import queue
+from collections import deque
+from .ledger_storage import LedgerStorage, JSONFileStorage, SegmentedFileStorage
+from .trace_index import TraceIndex
+from .verification_checkpoint import CheckpointStore
+from .merkle_accumulator import MerkleAccumulator
+
+class _PendingAppend:
+    """A signed event waiting for the group-commit writer."""
+
+    def __init__(self, signed_event: Dict[str, Any]):
+        self.signed_event = signed_event
+        self.enqueued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.index: Optional[int] = None
+        self.error: Optional[Exception] = None
 
 class HashChainLedger:
-    def __init__(self, ledger_file: str = 'provenance_ledger.json'):
+    def __init__(self, ledger_file: str = 'provenance_ledger.json', storage_dir: Optional[str] = None,
+                 backend: Optional[str] = None, segment_size: Optional[int] = None,
+                 group_commit: Optional[bool] = None, max_batch_size: Optional[int] = None,
+                 max_batch_wait_ms: Optional[float] = None):
         self.ledger_file = ledger_file
+        self.backend = backend or os.getenv('LEDGER_BACKEND', 'segmented')
+        self.storage_dir = storage_dir or os.getenv(
+            'LEDGER_STORAGE_DIR', os.path.splitext(ledger_file)[0] + '_segments'
+        )
+        self.segment_size = int(segment_size or os.getenv('LEDGER_SEGMENT_SIZE', 10000))
+        # Guards this instance; storage.exclusive() serializes appends and catch-up across processes
         self.lock = threading.Lock()
-        self._ensure_ledger_exists()
+        self.storage = self._create_storage()
+        self.checkpoints = CheckpointStore(self._checkpoint_file())
+
+        # trace_id -> ledger positions, caught up from storage on startup
+        self.trace_index = TraceIndex(self._trace_index_file())
+
+        # Merkle tree over event hashes for O(log n) inclusion/consistency proofs
+        self.merkle = MerkleAccumulator(self._merkle_leaves_file())
+
+        with self.storage.exclusive():
+            self.storage.refresh()
+            self._ensure_ledger_exists()
+            self.trace_index.rebuild(self.storage)
+            self.merkle.rebuild(self.storage)
+
+            # Tail of the chain is cached so appends only read from storage when
+            # another process has appended since (see _catch_up)
+            self._tail_hash = self.storage.last_entry()['event_hash']
+            self._length = self.storage.length()
+
+        # Commit latency (enqueue -> durable) for the most recent appends. Appenders
+        # record outside self.lock, so the counters have their own lock.
+        self._stats_lock = threading.Lock()
+        self._commit_latencies = deque(maxlen=1000)
+        self._batches_committed = 0
+        self._entries_committed = 0
+
+        # Group commit: one writer links, hashes and syncs batches of queued events
+        if group_commit is None:
+            group_commit = os.getenv('LEDGER_GROUP_COMMIT', 'false').lower() in ('1', 'true', 'yes')
+        self.group_commit = group_commit
+        self.max_batch_size = int(max_batch_size or os.getenv('LEDGER_MAX_BATCH_SIZE', 256))
+        if max_batch_wait_ms is None:
+            max_batch_wait_ms = float(os.getenv('LEDGER_MAX_BATCH_WAIT_MS', 2))
+        self.max_batch_wait = max_batch_wait_ms / 1000.0
+        if self.group_commit:
+            self._append_queue: "queue.Queue[_PendingAppend]" = queue.Queue()
+            self.writer_thread = threading.Thread(target=self._group_commit_loop, daemon=True)
+            self.writer_thread.start()
+
+    def _create_storage(self) -> LedgerStorage:
+        if self.backend == 'json':
+            return JSONFileStorage(self.ledger_file)
+        elif self.backend == 'segmented':
+            return SegmentedFileStorage(self.storage_dir, self.segment_size)
+        else:
+            raise ValueError(f"Unsupported ledger backend: {self.backend}")
+
+    def _trace_index_file(self) -> Optional[str]:
+        # The legacy JSON backend keeps the index in memory only
+        if self.backend == 'segmented':
+            return os.path.join(self.storage_dir, 'trace_index.jsonl')
+        return None
+
+    def _merkle_leaves_file(self) -> Optional[str]:
+        if self.backend == 'segmented':
+            return os.path.join(self.storage_dir, 'merkle_leaves.bin')
+        return None
+
+    def _checkpoint_file(self) -> str:
+        if self.backend == 'segmented':
+            return os.path.join(self.storage_dir, 'checkpoints.jsonl')
+        return os.path.splitext(self.ledger_file)[0] + '_checkpoints.jsonl'
 
     def _ensure_ledger_exists(self):
-        if not os.path.exists(self.ledger_file):
-            genesis_entry = {
-                "index": 0,
-                "timestamp": datetime.utcnow().isoformat() + 'Z',
-                "event_hash": "genesis",
-                "prev_hash": "0" * 64,  # 64 zeros for SHA256
-                "signed_event": None
-            }
-            with open(self.ledger_file, 'w') as f:
-                json.dump([genesis_entry], f, indent=2)
+        if self.storage.length() > 0:
+            return
 
-    def _load_ledger(self) -> List[Dict[str, Any]]:
-        with open(self.ledger_file, 'r') as f:
-            return json.load(f)
+        # Migrate an existing JSON ledger into a fresh segmented store, verified
+        # like import_json and written with a single batch
+        if self.backend == 'segmented' and os.path.exists(self.ledger_file):
+            with open(self.ledger_file, 'r') as f:
+                entries = json.load(f)
+            if entries:
+                self._verify_json_entries(entries, self.ledger_file)
+                self.storage.append_batch(entries)
+                return
 
-    def _save_ledger(self, ledger: List[Dict[str, Any]]):
-        with open(self.ledger_file, 'w') as f:
-            json.dump(ledger, f, indent=2)
+        genesis_entry = {
+            "index": 0,
+            "timestamp": datetime.utcnow().isoformat() + 'Z',
+            "event_hash": "genesis",
+            "prev_hash": "0" * 64,  # 64 zeros for SHA256
+            "signed_event": None
+        }
+        self.storage.append(genesis_entry)
 
     def _compute_event_hash(self, signed_event: Dict[str, Any]) -> str:
         """Compute SHA256 hash of the signed event."""
@@ -38,58 +129,309 @@ class HashChainLedger:
 
     def append_event(self, signed_event: Dict[str, Any]) -> int:
         """Append a signed event to the ledger and return its index."""
-        with self.lock:
-            ledger = self._load_ledger()
-            prev_entry = ledger[-1]
-            prev_hash = prev_entry['event_hash']
-
-            event_hash = self._compute_event_hash(signed_event)
-
-            new_entry = {
-                "index": len(ledger),
-                "timestamp": datetime.utcnow().isoformat() + 'Z',
-                "event_hash": event_hash,
-                "prev_hash": prev_hash,
-                "signed_event": signed_event
-            }
+        if self.group_commit:
+            pending = _PendingAppend(signed_event)
+            self._append_queue.put(pending)
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.index
+
+        started = time.perf_counter()
+        index = self._commit_batch([signed_event])[0]
+        self._record_commit([time.perf_counter() - started])
+        return index
+
+    def _catch_up(self):
+        """Resync the cached tail and indexes with entries other processes appended (storage lock held)."""
+        self.storage.refresh()
+        if self.storage.length() == self._length:
+            return
+        self._tail_hash = self.storage.last_entry()['event_hash']
+        self._length = self.storage.length()
+        self.trace_index.catch_up(self.storage)
+        self.merkle.catch_up(self.storage)
+
+    def _refresh(self):
+        """Catch up with entries other processes appended before serving a read."""
+        with self.lock, self.storage.exclusive():
+            self._catch_up()
+
+    def _commit_batch(self, signed_events: List[Dict[str, Any]]) -> List[int]:
+        """Link, hash and durably write a batch of signed events in chain order."""
+        with self.lock, self.storage.exclusive():
+            self._catch_up()
+            entries = []
+            tail_hash = self._tail_hash
+            for offset, signed_event in enumerate(signed_events):
+                event_hash = self._compute_event_hash(signed_event)
+                entries.append({
+                    "index": self._length + offset,
+                    "timestamp": datetime.utcnow().isoformat() + 'Z',
+                    "event_hash": event_hash,
+                    "prev_hash": tail_hash,
+                    "signed_event": signed_event
+                })
+                tail_hash = event_hash
+
+            try:
+                locations = self.storage.append_batch(entries)
+            except Exception:
+                # Part of the batch may have reached disk - resync the tail and indexes from storage
+                self._tail_hash = self.storage.last_entry()['event_hash']
+                self._length = self.storage.length()
+                self.trace_index.rebuild(self.storage)
+                self.merkle.rebuild(self.storage)
+                raise
+
+            self.trace_index.add_batch([
+                (entry["index"], entry, location) for entry, location in zip(entries, locations)
+            ])
+            self.merkle.add_batch([entry["event_hash"] for entry in entries])
+            self._tail_hash = tail_hash
+            self._length += len(entries)
+            return [entry["index"] for entry in entries]
+
+    def _group_commit_loop(self):
+        """Writer thread: gather queued appends up to max_batch_size / max_batch_wait and commit them together."""
+        while True:
+            batch = [self._append_queue.get()]
+            deadline = time.perf_counter() + self.max_batch_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    if remaining > 0:
+                        batch.append(self._append_queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._append_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                indices = self._commit_batch([pending.signed_event for pending in batch])
+                for pending, index in zip(batch, indices):
+                    pending.index = index
+            except Exception as e:
+                for pending in batch:
+                    pending.error = e
 
-            ledger.append(new_entry)
-            self._save_ledger(ledger)
-            return new_entry["index"]
+            committed_at = time.perf_counter()
+            self._record_commit([committed_at - pending.enqueued_at for pending in batch])
+            for pending in batch:
+                pending.done.set()
+
+    def _record_commit(self, latencies: List[float]):
+        with self._stats_lock:
+            self._batches_committed += 1
+            self._entries_committed += len(latencies)
+            self._commit_latencies.extend(latencies)
+
+    def get_commit_stats(self) -> Dict[str, Any]:
+        """Commit throughput and latency over the most recent appends."""
+        with self._stats_lock:
+            latencies = sorted(self._commit_latencies)
+            batches_committed = self._batches_committed
+            entries_committed = self._entries_committed
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return {
+            "mode": "group_commit" if self.group_commit else "per_append",
+            "max_batch_size": self.max_batch_size,
+            "max_batch_wait_ms": self.max_batch_wait * 1000,
+            "batches_committed": batches_committed,
+            "entries_committed": entries_committed,
+            "avg_batch_size": entries_committed / batches_committed if batches_committed else 0.0,
+            "commit_latency_ms": {
+                "avg": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+                "p50": percentile(0.50),
+                "p99": percentile(0.99),
+                "max": latencies[-1] * 1000 if latencies else 0.0
+            }
+        }
 
     def get_entry(self, index: int) -> Optional[Dict[str, Any]]:
         """Get a specific entry by index."""
-        ledger = self._load_ledger()
-        if 0 <= index < len(ledger):
-            return ledger[index]
-        return None
+        self._refresh()
+        return self.storage.get(index)
+
+    def iter_entries(self, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """Stream ledger entries in chain order without loading the whole chain."""
+        self._refresh()
+        return self.storage.iter_entries(start)
+
+    def get_trace_entries(self, trace_id: str) -> List[Dict[str, Any]]:
+        """Get all entries for a trace_id in chain order, reading only that trace's records."""
+        self._refresh()
+        return self.storage.get_many(self.trace_index.lookup(trace_id))
 
     def get_all_entries(self) -> List[Dict[str, Any]]:
         """Get all ledger entries."""
-        return self._load_ledger()
+        self._refresh()
+        return list(self.storage.iter_entries())
+
+    def verify_chain_integrity(self, full: bool = False) -> bool:
+        """Verify the chain's integrity, resuming from the last checkpoint unless full is set."""
+        return self.verify_chain(full=full)["chain_valid"]
+
+    def verify_chain(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Verify hash links and event hashes, re-hashing only entries after the
+        latest signed checkpoint. full=True re-verifies from genesis for audits.
+
+        Returns:
+            Verification report with range checked and throughput in entries/s
+        """
+        started = time.perf_counter()
+        self._refresh()
+        end = self._length
+        checkpoint = None if full else self.checkpoints.get_latest()
+
+        if checkpoint and checkpoint["verified_index"] < end:
+            start = checkpoint["verified_index"]
+            anchor = self.storage.get(start)
+            # The checkpointed entry itself must be unchanged for the resume point to be trusted
+            chain_valid = anchor is not None and anchor["event_hash"] == checkpoint["tail_hash"]
+            first_invalid_index = None if chain_valid else start
+        else:
+            start = 0
+            chain_valid = True
+            first_invalid_index = None
+            checkpoint = None
 
-    def verify_chain_integrity(self) -> bool:
-        """Verify the entire chain's integrity."""
-        ledger = self._load_ledger()
-        for i in range(1, len(ledger)):
-            current = ledger[i]
-            previous = ledger[i-1]
+        verified = 0
+        tail_hash = None
+        if chain_valid:
+            previous = None
+            for current in self.storage.iter_entries(start):
+                if current["index"] >= end:
+                    break
+                if previous is not None:
+                    verified += 1
+                    if not self._is_valid_link(previous, current):
+                        chain_valid = False
+                        first_invalid_index = current["index"]
+                        break
+                previous = current
 
-            # Check prev_hash matches
-            if current['prev_hash'] != previous['event_hash']:
-                return False
+            if chain_valid and previous is not None:
+                tail_hash = previous["event_hash"]
+                if checkpoint is None or previous["index"] > checkpoint["verified_index"]:
+                    self.checkpoints.record(previous["index"], tail_hash)
 
-            # Check event_hash is correct
-            if current['signed_event']:
-                expected_hash = self._compute_event_hash(current['signed_event'])
-                if current['event_hash'] != expected_hash:
-                    return False
+        elapsed = time.perf_counter() - started
+        return {
+            "chain_valid": chain_valid,
+            "mode": "full" if full else "incremental",
+            "resumed_from_checkpoint": checkpoint is not None,
+            "verified_from": start,
+            "verified_to": end - 1,
+            "entries_verified": verified,
+            "first_invalid_index": first_invalid_index,
+            "tail_hash": tail_hash,
+            "duration_seconds": elapsed,
+            "entries_per_second": verified / elapsed if elapsed > 0 else 0.0
+        }
 
+    def _is_valid_link(self, previous: Dict[str, Any], current: Dict[str, Any]) -> bool:
+        """Check that current links to previous and that its event_hash matches its payload."""
+        if current['prev_hash'] != previous['event_hash']:
+            return False
+        if current['signed_event']:
+            return current['event_hash'] == self._compute_event_hash(current['signed_event'])
         return True
 
+    def _verify_json_entries(self, entries: List[Dict[str, Any]], source: str):
+        """Apply verify_chain's checks to a JSON array ledger before any of it is written."""
+        if not entries or entries[0]['event_hash'] != 'genesis':
+            raise ValueError(f"{source} does not start with a genesis entry")
+
+        for position, (previous, current) in enumerate(zip(entries, entries[1:]), start=1):
+            if current.get('index') != position or not self._is_valid_link(previous, current):
+                raise ValueError(f"{source} has a broken hash chain at index {position}")
+
     def get_chain_length(self) -> int:
         """Get the current length of the chain."""
-        return len(self._load_ledger())
+        self._refresh()
+        return self._length
+
+    def get_merkle_root(self, tree_size: Optional[int] = None) -> Dict[str, Any]:
+        """Get the Merkle root over the first tree_size entries (defaults to the whole chain)."""
+        with self.lock, self.storage.exclusive():
+            self._catch_up()
+            tree_size = self.merkle.size if tree_size is None else tree_size
+            return {"tree_size": tree_size, "root": self.merkle.root(tree_size).hex()}
+
+    def get_inclusion_proof(self, index: int, tree_size: Optional[int] = None) -> Dict[str, Any]:
+        """Get an O(log n) proof that the entry at index is included in the chain of tree_size."""
+        with self.lock, self.storage.exclusive():
+            self._catch_up()
+            tree_size = self.merkle.size if tree_size is None else tree_size
+            proof = self.merkle.inclusion_proof(index, tree_size)
+            return {
+                "index": index,
+                "tree_size": tree_size,
+                "leaf_hash": self.merkle.levels[0][index].hex(),
+                "root": self.merkle.root(tree_size).hex(),
+                "audit_path": [node.hex() for node in proof]
+            }
+
+    def get_consistency_proof(self, first_size: int, second_size: Optional[int] = None) -> Dict[str, Any]:
+        """Get a proof that the chain of first_size is a prefix of the chain of second_size."""
+        with self.lock, self.storage.exclusive():
+            self._catch_up()
+            second_size = self.merkle.size if second_size is None else second_size
+            proof = self.merkle.consistency_proof(first_size, second_size)
+            return {
+                "first_size": first_size,
+                "second_size": second_size,
+                "first_root": self.merkle.root(first_size).hex(),
+                "second_root": self.merkle.root(second_size).hex(),
+                "proof": [node.hex() for node in proof]
+            }
+
+    def export_json(self, export_file: Optional[str] = None) -> str:
+        """Export the chain to the JSON array format and return the file path."""
+        export_file = export_file or self.ledger_file
+        with self.lock, self.storage.exclusive():
+            self._catch_up()
+            entries = list(self.storage.iter_entries())
+        with open(export_file, 'w') as f:
+            json.dump(entries, f, indent=2)
+        return export_file
+
+    def import_json(self, import_file: str) -> int:
+        """
+        Import a JSON array ledger into a genesis-only store.
+        Every genesis entry hashes to "genesis", so the local genesis is kept
+        and the imported events link onto it unchanged. The file is rejected
+        with ValueError if any hash link or event hash fails to verify.
+
+        Returns:
+            Number of events imported (excluding genesis)
+        """
+        with open(import_file, 'r') as f:
+            entries = json.load(f)
+        self._verify_json_entries(entries, import_file)
+
+        with self.lock, self.storage.exclusive():
+            self._catch_up()
+            if self._length > 1:
+                raise ValueError("Ledger already contains events; import requires an empty ledger")
+
+            events = entries[1:]
+            locations = self.storage.append_batch(events)
+            self.trace_index.add_batch([
+                (entry["index"], entry, location) for entry, location in zip(events, locations)
+            ])
+            self.merkle.add_batch([entry["event_hash"] for entry in events])
+            self._tail_hash = entries[-1]['event_hash']
+            self._length = self.storage.length()
+            return len(entries) - 1
 
 # Global instance
 ledger = HashChainLedger()
\ No newline at end of file
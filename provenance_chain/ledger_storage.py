@@ -0,0 +1,313 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# (byte offset, byte length) of a record inside its segment file
+Location = Tuple[int, int]
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK gives up after ~10s of contention; keep waiting
+            continue
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return
+    f.seek(0)
+    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class LedgerStorage(ABC):
+    """
+    Storage backend for HashChainLedger entries.
+    Backends only persist and retrieve entries - hashing and linking stay in the ledger.
+
+    Several processes may share one store. Writers hold exclusive() around
+    every read-modify-append, and readers take it briefly before serving a
+    read; both call refresh() under it to see entries appended by other processes.
+    """
+
+    # Path of the inter-process lock file; None disables locking
+    lock_file: Optional[str] = None
+
+    @contextmanager
+    def exclusive(self):
+        """Hold the store's inter-process write lock."""
+        if self.lock_file is None:
+            yield
+            return
+        with open(self.lock_file, 'a+b') as f:
+            _lock_file(f)
+            try:
+                yield
+            finally:
+                _unlock_file(f)
+
+    def refresh(self):
+        """Pick up entries appended by other processes; call while holding exclusive()."""
+        pass
+
+    @abstractmethod
+    def append(self, entry: Dict[str, Any]) -> Optional[Location]:
+        """Durably persist a single entry at the end of the chain and return its location, if any."""
+        pass
+
+    def append_batch(self, entries: List[Dict[str, Any]]) -> List[Optional[Location]]:
+        """Persist several entries at once; backends override this to write and sync once."""
+        return [self.append(entry) for entry in entries]
+
+    @abstractmethod
+    def get(self, index: int, location: Optional[Location] = None) -> Optional[Dict[str, Any]]:
+        """Return the entry stored at index, or None if out of range."""
+        pass
+
+    def get_many(self, postings: List[Tuple[int, Optional[Location]]]) -> List[Dict[str, Any]]:
+        """Return the entries for a list of (index, location) postings."""
+        entries = []
+        for index, location in postings:
+            entry = self.get(index, location)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
+    @abstractmethod
+    def iter_located(self, start: int = 0) -> Iterator[Tuple[int, Dict[str, Any], Optional[Location]]]:
+        """Yield (index, entry, location) tuples in chain order starting at index start."""
+        pass
+
+    def iter_entries(self, start: int = 0) -> Iterator[Dict[str, Any]]:
+        """Yield entries in chain order starting at index start."""
+        for _, entry, _ in self.iter_located(start):
+            yield entry
+
+    @abstractmethod
+    def length(self) -> int:
+        """Number of entries currently stored."""
+        pass
+
+    def last_entry(self) -> Optional[Dict[str, Any]]:
+        """Return the tail entry of the chain."""
+        count = self.length()
+        return self.get(count - 1) if count else None
+
+
+class JSONFileStorage(LedgerStorage):
+    """
+    Legacy backend that keeps the whole chain in a single JSON array.
+    Every append rewrites the file, so appends are O(chain length).
+    """
+
+    def __init__(self, ledger_file: str):
+        self.ledger_file = ledger_file
+        self.lock_file = ledger_file + '.lock'
+
+    def _load(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.ledger_file):
+            return []
+        with open(self.ledger_file, 'r') as f:
+            return json.load(f)
+
+    def _save(self, entries: List[Dict[str, Any]]):
+        with open(self.ledger_file, 'w') as f:
+            json.dump(entries, f, indent=2)
+
+    def append(self, entry: Dict[str, Any]) -> Optional[Location]:
+        return self.append_batch([entry])[0]
+
+    def append_batch(self, entries: List[Dict[str, Any]]) -> List[Optional[Location]]:
+        stored = self._load()
+        stored.extend(entries)
+        self._save(stored)
+        return [None] * len(entries)
+
+    def get(self, index: int, location: Optional[Location] = None) -> Optional[Dict[str, Any]]:
+        entries = self._load()
+        if 0 <= index < len(entries):
+            return entries[index]
+        return None
+
+    def get_many(self, postings: List[Tuple[int, Optional[Location]]]) -> List[Dict[str, Any]]:
+        entries = self._load()
+        return [entries[index] for index, _ in postings if 0 <= index < len(entries)]
+
+    def iter_located(self, start: int = 0) -> Iterator[Tuple[int, Dict[str, Any], Optional[Location]]]:
+        start = max(start, 0)
+        for offset, entry in enumerate(self._load()[start:]):
+            yield start + offset, entry, None
+
+    def length(self) -> int:
+        return len(self._load())
+
+
+class SegmentedFileStorage(LedgerStorage):
+    """
+    Append-only backend that stores newline-delimited JSON entries in
+    fixed-size segment files (segment_00000000.jsonl, segment_00000001.jsonl, ...).
+
+    An append writes and fsyncs only the new record(s). The entry count is kept
+    in memory, and the segment size is pinned in a manifest so existing
+    directories stay readable if the configured size changes. refresh() only
+    re-counts entries when the open segment's size on disk has changed.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    LOCK_FILE = "ledger.lock"
+    SEGMENT_PREFIX = "segment_"
+    SEGMENT_SUFFIX = ".jsonl"
+
+    def __init__(self, storage_dir: str, segment_size: int = 10000):
+        self.storage_dir = storage_dir
+        os.makedirs(self.storage_dir, exist_ok=True)
+        self.lock_file = os.path.join(self.storage_dir, self.LOCK_FILE)
+        # Bytes written to the segment the next append goes to
+        self._segment_bytes = 0
+        with self.exclusive():
+            self.segment_size = self._load_or_create_manifest(segment_size)
+            self._length = self._recover_length()
+
+    def _load_or_create_manifest(self, segment_size: int) -> int:
+        manifest_path = os.path.join(self.storage_dir, self.MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, 'r') as f:
+                return int(json.load(f)["segment_size"])
+
+        with open(manifest_path, 'w') as f:
+            json.dump({"format": "jsonl-segments", "version": 1, "segment_size": segment_size}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        return segment_size
+
+    def _segment_path(self, segment_number: int) -> str:
+        return os.path.join(self.storage_dir, f"{self.SEGMENT_PREFIX}{segment_number:08d}{self.SEGMENT_SUFFIX}")
+
+    def _segment_numbers(self) -> List[int]:
+        numbers = []
+        for name in os.listdir(self.storage_dir):
+            if name.startswith(self.SEGMENT_PREFIX) and name.endswith(self.SEGMENT_SUFFIX):
+                numbers.append(int(name[len(self.SEGMENT_PREFIX):-len(self.SEGMENT_SUFFIX)]))
+        return sorted(numbers)
+
+    def _recover_length(self) -> int:
+        """Count entries, truncating a torn trailing record left by a crash mid-append."""
+        segments = self._segment_numbers()
+        if not segments:
+            self._segment_bytes = 0
+            return 0
+
+        last_segment = segments[-1]
+        path = self._segment_path(last_segment)
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        complete = data.rfind(b'\n') + 1
+        if complete != len(data):
+            with open(path, 'r+b') as f:
+                f.truncate(complete)
+                f.flush()
+                os.fsync(f.fileno())
+
+        count = data[:complete].count(b'\n')
+        self._segment_bytes = 0 if count >= self.segment_size else complete
+        return last_segment * self.segment_size + count
+
+    def refresh(self):
+        path = self._segment_path(self._length // self.segment_size)
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size != self._segment_bytes:
+            self._length = self._recover_length()
+
+    def _read_segment(self, segment_number: int) -> bytes:
+        path = self._segment_path(segment_number)
+        if not os.path.exists(path):
+            return b''
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def append(self, entry: Dict[str, Any]) -> Optional[Location]:
+        return self.append_batch([entry])[0]
+
+    def append_batch(self, entries: List[Dict[str, Any]]) -> List[Optional[Location]]:
+        """Write a batch with one write and one fsync per segment it touches."""
+        locations: List[Optional[Location]] = []
+        position = 0
+
+        while position < len(entries):
+            segment_number = self._length // self.segment_size
+            room = self.segment_size - self._length % self.segment_size
+            chunk = entries[position:position + room]
+
+            records = [(json.dumps(entry, sort_keys=True, separators=(',', ':')) + '\n').encode()
+                       for entry in chunk]
+            with open(self._segment_path(segment_number), 'ab') as f:
+                offset = f.tell()
+                f.write(b''.join(records))
+                f.flush()
+                os.fsync(f.fileno())
+
+            for record in records:
+                locations.append((offset, len(record)))
+                offset += len(record)
+            self._length += len(chunk)
+            self._segment_bytes = 0 if self._length % self.segment_size == 0 else offset
+            position += len(chunk)
+
+        return locations
+
+    def get(self, index: int, location: Optional[Location] = None) -> Optional[Dict[str, Any]]:
+        if not 0 <= index < self._length:
+            return None
+
+        if location is not None:
+            # Direct seek - reads only this record
+            offset, length = location
+            with open(self._segment_path(index // self.segment_size), 'rb') as f:
+                f.seek(offset)
+                return json.loads(f.read(length))
+
+        lines = self._read_segment(index // self.segment_size).splitlines()
+        return json.loads(lines[index % self.segment_size])
+
+    def iter_located(self, start: int = 0) -> Iterator[Tuple[int, Dict[str, Any], Optional[Location]]]:
+        start = max(start, 0)
+        end = self._length
+        segment_number = start // self.segment_size
+        skip = start % self.segment_size
+        index = start
+
+        while index < end:
+            data = self._read_segment(segment_number)
+            if not data:
+                return
+            offset = 0
+            position = 0
+            while offset < len(data) and index < end:
+                line_end = data.index(b'\n', offset) + 1
+                if position >= skip:
+                    yield index, json.loads(data[offset:line_end]), (offset, line_end - offset)
+                    index += 1
+                offset = line_end
+                position += 1
+            segment_number += 1
+            skip = 0
+
+    def length(self) -> int:
+        return self._length
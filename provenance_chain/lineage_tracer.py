@@ -7,17 +7,14 @@ class LineageTracer:
 
     def get_trace_history(self, trace_id: str) -> Dict[str, Any]:
         """Retrieve the complete ordered trace history for a given trace_id."""
-        all_entries = self.ledger.get_all_entries()
-
-        # Filter entries for this trace_id
+        # Indexed lookup - reads only this trace's entries
         trace_events = []
-        for entry in all_entries:
-            if entry['signed_event'] and entry['signed_event']['event']['trace_id'] == trace_id:
-                trace_events.append({
-                    "index": entry["index"],
-                    "timestamp": entry["timestamp"],
-                    "signed_event": entry["signed_event"]
-                })
+        for entry in self.ledger.get_trace_entries(trace_id):
+            trace_events.append({
+                "index": entry["index"],
+                "timestamp": entry["timestamp"],
+                "signed_event": entry["signed_event"]
+            })
 
         # Sort by timestamp
         trace_events.sort(key=lambda x: x["timestamp"])
@@ -48,10 +45,9 @@ class LineageTracer:
 
     def get_recent_traces(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get the most recent traces."""
-        all_entries = self.ledger.get_all_entries()
-
         # Get recent entries
-        recent_entries = all_entries[-limit:] if len(all_entries) > limit else all_entries
+        start = max(self.ledger.get_chain_length() - limit, 0)
+        recent_entries = list(self.ledger.iter_entries(start))
 
         # Group by trace_id
         traces = {}
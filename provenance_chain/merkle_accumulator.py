@@ -0,0 +1,223 @@
+import hashlib
+import os
+from typing import List, Optional
+from .ledger_storage import LedgerStorage
+
+HASH_SIZE = 32
+
+
+def _leaf_hash(data: bytes) -> bytes:
+    return hashlib.sha256(b'\x00' + data).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b'\x01' + left + right).digest()
+
+
+def _largest_power_of_two_below(n: int) -> int:
+    """Largest power of two strictly less than n (n > 1)."""
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+class MerkleAccumulator:
+    """
+    Append-only Merkle tree over ledger event hashes (RFC 6962 / 9162 layout).
+
+    Every complete power-of-two subtree is cached as soon as it fills, so an
+    append costs amortised O(1) hashes and any subtree root needed by a proof
+    is assembled from O(log n) cached nodes. Leaf hashes are persisted to a
+    binary sidecar so startup only has to hash entries it has not seen.
+    """
+
+    def __init__(self, leaves_file: Optional[str] = None):
+        self.leaves_file = leaves_file
+        # levels[k][i] is the root of the perfect subtree covering leaves [i * 2^k, (i + 1) * 2^k)
+        self.levels: List[List[bytes]] = [[]]
+
+    @property
+    def size(self) -> int:
+        return len(self.levels[0])
+
+    @staticmethod
+    def leaf_data(event_hash: str) -> bytes:
+        return event_hash.encode()
+
+    def rebuild(self, storage: LedgerStorage):
+        """Load persisted leaves and catch up on any ledger entries not yet accumulated."""
+        self.levels = [[]]
+        leaves = self._load_sidecar()
+
+        if len(leaves) > storage.length():
+            # Sidecar is ahead of the ledger (ledger was reset) - start over
+            leaves = []
+            if self.leaves_file and os.path.exists(self.leaves_file):
+                os.remove(self.leaves_file)
+
+        for leaf in leaves:
+            self._push_leaf(leaf)
+        self.add_batch([entry["event_hash"] for entry in storage.iter_entries(self.size)])
+
+    def catch_up(self, storage: LedgerStorage):
+        """Load leaves other writers appended to the sidecar, then accumulate any entries still missing."""
+        for leaf in self._load_sidecar(self.size):
+            self._push_leaf(leaf)
+        self.add_batch([entry["event_hash"] for entry in storage.iter_entries(self.size)])
+
+    def _load_sidecar(self, start: int = 0) -> List[bytes]:
+        """Persisted leaves from leaf index start onwards, dropping a torn trailing hash."""
+        if not self.leaves_file or not os.path.exists(self.leaves_file):
+            return []
+
+        with open(self.leaves_file, 'rb') as f:
+            f.seek(start * HASH_SIZE)
+            data = f.read()
+
+        usable = len(data) - len(data) % HASH_SIZE
+        if usable != len(data):
+            with open(self.leaves_file, 'r+b') as f:
+                f.truncate(start * HASH_SIZE + usable)
+        return [data[i:i + HASH_SIZE] for i in range(0, usable, HASH_SIZE)]
+
+    def _push_leaf(self, leaf: bytes):
+        self.levels[0].append(leaf)
+        level = 0
+        # Fold completed pairs upwards
+        while len(self.levels[level]) % 2 == 0:
+            if len(self.levels) == level + 1:
+                self.levels.append([])
+            nodes = self.levels[level]
+            self.levels[level + 1].append(_node_hash(nodes[-2], nodes[-1]))
+            level += 1
+
+    def add(self, event_hash: str) -> int:
+        """Accumulate an event hash and return its leaf index."""
+        return self.add_batch([event_hash])[-1]
+
+    def add_batch(self, event_hashes: List[str]) -> List[int]:
+        """Accumulate several event hashes, persisting their leaves in one write."""
+        leaves = [_leaf_hash(self.leaf_data(event_hash)) for event_hash in event_hashes]
+        if self.leaves_file and leaves:
+            with open(self.leaves_file, 'ab') as f:
+                f.write(b''.join(leaves))
+
+        first = self.size
+        for leaf in leaves:
+            self._push_leaf(leaf)
+        return list(range(first, self.size))
+
+    def _subtree_hash(self, start: int, size: int) -> bytes:
+        """Root of leaves [start, start + size); start is always aligned to the subtree split."""
+        if size & (size - 1) == 0 and start % size == 0:
+            return self.levels[size.bit_length() - 1][start // size]
+        k = _largest_power_of_two_below(size)
+        return _node_hash(self._subtree_hash(start, k), self._subtree_hash(start + k, size - k))
+
+    def root(self, tree_size: Optional[int] = None) -> bytes:
+        """Merkle root over the first tree_size leaves (defaults to all)."""
+        tree_size = self.size if tree_size is None else tree_size
+        if tree_size == 0:
+            return hashlib.sha256(b'').digest()
+        self._check_size(tree_size)
+        return self._subtree_hash(0, tree_size)
+
+    def _check_size(self, tree_size: int):
+        if not 0 < tree_size <= self.size:
+            raise ValueError(f"Tree size {tree_size} out of range (1..{self.size})")
+
+    def inclusion_proof(self, index: int, tree_size: Optional[int] = None) -> List[bytes]:
+        """Audit path proving leaf index is included in the tree of size tree_size."""
+        tree_size = self.size if tree_size is None else tree_size
+        self._check_size(tree_size)
+        if not 0 <= index < tree_size:
+            raise ValueError(f"Leaf index {index} out of range for tree size {tree_size}")
+
+        proof = []
+        start, size, m = 0, tree_size, index
+        while size > 1:
+            k = _largest_power_of_two_below(size)
+            if m < k:
+                proof.append(self._subtree_hash(start + k, size - k))
+                size = k
+            else:
+                proof.append(self._subtree_hash(start, k))
+                start, size, m = start + k, size - k, m - k
+        proof.reverse()
+        return proof
+
+    def consistency_proof(self, first_size: int, second_size: int) -> List[bytes]:
+        """Proof that the tree of first_size is a prefix of the tree of second_size."""
+        self._check_size(second_size)
+        if not 0 < first_size <= second_size:
+            raise ValueError(f"Invalid consistency range {first_size}..{second_size}")
+        if first_size == second_size:
+            return []
+
+        proof = []
+        start, size, m, complete_subtree = 0, second_size, first_size, True
+        while m != size:
+            k = _largest_power_of_two_below(size)
+            if m <= k:
+                proof.append(self._subtree_hash(start + k, size - k))
+                size = k
+            else:
+                proof.append(self._subtree_hash(start, k))
+                start, size, m, complete_subtree = start + k, size - k, m - k, False
+        if not complete_subtree:
+            proof.append(self._subtree_hash(start, m))
+        proof.reverse()
+        return proof
+
+    @staticmethod
+    def verify_inclusion(leaf: bytes, index: int, tree_size: int,
+                         proof: List[bytes], root: bytes) -> bool:
+        """Verify an inclusion proof (RFC 9162 section 2.1.3.2)."""
+        if not 0 <= index < tree_size:
+            return False
+        fn, sn, r = index, tree_size - 1, leaf
+        for p in proof:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                r = _node_hash(p, r)
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                r = _node_hash(r, p)
+            fn >>= 1
+            sn >>= 1
+        return sn == 0 and r == root
+
+    @staticmethod
+    def verify_consistency(first_size: int, second_size: int, first_root: bytes,
+                           second_root: bytes, proof: List[bytes]) -> bool:
+        """Verify a consistency proof (RFC 9162 section 2.1.4.2)."""
+        if not 0 < first_size <= second_size:
+            return False
+        if first_size == second_size:
+            return not proof and first_root == second_root
+        if first_size & (first_size - 1) == 0:
+            proof = [first_root] + proof
+        if not proof:
+            return False
+
+        fn, sn = first_size - 1, second_size - 1
+        while fn & 1:
+            fn >>= 1
+            sn >>= 1
+
+        fr = sr = proof[0]
+        for c in proof[1:]:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                fr = _node_hash(c, fr)
+                sr = _node_hash(c, sr)
+                while not fn & 1 and fn != 0:
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                sr = _node_hash(sr, c)
+            fn >>= 1
+            sn >>= 1
+        return fr == first_root and sr == second_root and sn == 0
@@ -1,73 +1,62 @@
 import uuid
 import time
 import threading
-from typing import Set
+from typing import Dict, Any
 import os
+from .nonce_store import NonceStore, ShardedMemoryNonceStore, SQLiteNonceStore
 
 class NonceManager:
-    def __init__(self, ttl_seconds: int = 600):  # 10 minutes default
+    def __init__(self, ttl_seconds: int = 600, num_shards: int = 16,  # 10 minutes default
+                 backend: str = None, db_path: str = None):
         self.ttl_seconds = int(os.getenv('NONCE_TTL_SECONDS', ttl_seconds))
-        self.used_nonces: Set[str] = set()
-        self.lock = threading.Lock()
+        self.backend = backend or os.getenv('NONCE_BACKEND', 'memory')
+        self.cleanup_interval = 60  # The whole table is swept once per interval
+
+        # 'memory' is per-process; 'sqlite' is shared by every worker on the host
+        if self.backend == 'memory':
+            self.store: NonceStore = ShardedMemoryNonceStore(int(os.getenv('NONCE_SHARDS', num_shards)))
+        elif self.backend == 'sqlite':
+            self.store = SQLiteNonceStore(db_path or os.getenv('NONCE_DB_PATH', 'nonces.db'))
+        else:
+            raise ValueError(f"Unsupported nonce backend: {self.backend}")
+
         self.cleanup_thread = threading.Thread(target=self._cleanup_expired_nonces, daemon=True)
         self.cleanup_thread.start()
 
     def generate_nonce(self) -> str:
         """Generate a new unique nonce."""
         nonce = str(uuid.uuid4())
-        with self.lock:
-            self.used_nonces.add(f"{nonce}:{time.time()}")
+        self.store.add(nonce, time.time())
         return nonce
 
     def validate_nonce(self, nonce: str) -> bool:
-        """Validate a nonce - must be unused and within TTL."""
-        current_time = time.time()
-
-        with self.lock:
-            nonce_key = None
-            for stored in self.used_nonces:
-                if stored.startswith(f"{nonce}:"):
-                    nonce_key = stored
-                    break
-
-            if nonce_key is None:
-                return False  # Nonce not found (never generated)
+        """Validate a nonce - must be unused and within TTL. Consumes the nonce."""
+        return self.store.consume(nonce, time.time() - self.ttl_seconds)
 
-            # Check if already used
-            if nonce_key.endswith(":used"):
-                return False
+    def expire_nonces(self, current_time: float = None) -> int:
+        """Drop expired nonces and return how many were removed."""
+        current_time = time.time() if current_time is None else current_time
+        return self.store.expire(current_time - self.ttl_seconds)
 
-            # Check TTL
-            timestamp_str = nonce_key.split(":")[1]
-            if not timestamp_str.isdigit():
-                return False
+    def live_count(self) -> int:
+        """Number of issued nonces not yet consumed or swept."""
+        return self.store.live_count()
 
-            timestamp = float(timestamp_str)
-            if current_time - timestamp > self.ttl_seconds:
-                self.used_nonces.discard(nonce_key)  # Remove expired
-                return False
-
-            # Mark as used
-            self.used_nonces.discard(nonce_key)
-            self.used_nonces.add(f"{nonce}:{timestamp}:used")
-            return True
+    def get_contention_metrics(self) -> Dict[str, Any]:
+        """Occupancy and lock/database contention metrics for the nonce backend."""
+        return self.store.get_metrics()
 
     def _cleanup_expired_nonces(self):
-        """Background thread to clean up expired nonces."""
+        """Background thread that expires nonces in small steps spread across the interval."""
         while True:
-            time.sleep(60)  # Clean up every minute
-            current_time = time.time()
-
-            with self.lock:
-                expired = set()
-                for stored in self.used_nonces:
-                    parts = stored.split(":")
-                    if len(parts) >= 2 and parts[1].isdigit():
-                        timestamp = float(parts[1])
-                        if current_time - timestamp > self.ttl_seconds:
-                            expired.add(stored)
-
-                self.used_nonces -= expired
+            steps = self.store.sweep_steps()
+            for _ in range(steps):
+                time.sleep(self.cleanup_interval / steps)
+                try:
+                    self.store.sweep_step(time.time() - self.ttl_seconds)
+                except Exception:
+                    # A busy shared database must not kill the sweeper; retry next step
+                    continue
 
 # Global instance
-nonce_manager = NonceManager()
\ No newline at end of file
+nonce_manager = NonceManager()
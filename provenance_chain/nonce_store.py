@@ -0,0 +1,262 @@
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, List
+
+
+class NonceStore(ABC):
+    """
+    Backend for NonceManager. Implementations must make consume() an atomic
+    check-and-delete so a nonce can be accepted at most once.
+    """
+
+    @abstractmethod
+    def add(self, nonce: str, issued_at: float):
+        """Record a newly issued nonce."""
+        pass
+
+    @abstractmethod
+    def consume(self, nonce: str, not_before: float) -> bool:
+        """Atomically remove nonce; True only if it existed and was issued at or after not_before."""
+        pass
+
+    @abstractmethod
+    def expire(self, cutoff: float) -> int:
+        """Remove nonces issued before cutoff and return how many were removed."""
+        pass
+
+    @abstractmethod
+    def live_count(self) -> int:
+        """Number of issued nonces not yet consumed or expired."""
+        pass
+
+    @abstractmethod
+    def get_metrics(self) -> Dict[str, Any]:
+        """Backend-specific occupancy and contention metrics."""
+        pass
+
+    def sweep_step(self, cutoff: float) -> int:
+        """Expire one increment of work; the cleanup thread calls this repeatedly across the interval."""
+        return self.expire(cutoff)
+
+    def sweep_steps(self) -> int:
+        """Number of sweep_step calls that make up one full sweep."""
+        return 1
+
+
+class _NonceShard:
+    """One stripe of the nonce table with its own lock and contention counters."""
+
+    def __init__(self):
+        # nonce -> issue time. Every nonce shares one TTL, so insertion order is
+        # expiry order and the oldest live nonce is always at the front.
+        self.nonces: "OrderedDict[str, float]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def acquire(self):
+        """Take the shard lock, recording how long we waited when it was contended."""
+        if not self.lock.acquire(blocking=False):
+            started = time.perf_counter()
+            self.lock.acquire()
+            waited = time.perf_counter() - started
+            self.contended += 1
+            self.wait_seconds += waited
+            if waited > self.max_wait_seconds:
+                self.max_wait_seconds = waited
+        # Counters are only mutated while holding the lock
+        self.acquisitions += 1
+
+    def release(self):
+        self.lock.release()
+
+
+class ShardedMemoryNonceStore(NonceStore):
+    """
+    In-process nonce table split into lock-striped shards. Fast, but only
+    visible to the process that issued the nonce.
+    """
+
+    def __init__(self, num_shards: int = 16, sweep_batch_size: int = 256):
+        self.num_shards = num_shards
+        self.sweep_batch_size = sweep_batch_size  # Max nonces expired per lock hold
+        self.shards: List[_NonceShard] = [_NonceShard() for _ in range(self.num_shards)]
+        self._next_sweep_shard = 0
+
+    def _shard_for(self, nonce: str) -> _NonceShard:
+        return self.shards[hash(nonce) % self.num_shards]
+
+    def add(self, nonce: str, issued_at: float):
+        shard = self._shard_for(nonce)
+        shard.acquire()
+        try:
+            shard.nonces[nonce] = issued_at
+        finally:
+            shard.release()
+
+    def consume(self, nonce: str, not_before: float) -> bool:
+        shard = self._shard_for(nonce)
+        shard.acquire()
+        try:
+            # Consuming removes it, so a replay finds nothing
+            issued_at = shard.nonces.pop(nonce, None)
+        finally:
+            shard.release()
+        return issued_at is not None and issued_at >= not_before
+
+    def _expire_shard(self, shard: _NonceShard, cutoff: float) -> int:
+        """Expire a shard in bounded batches so no single lock hold is long."""
+        removed = 0
+        while True:
+            shard.acquire()
+            try:
+                batch = 0
+                while shard.nonces and batch < self.sweep_batch_size:
+                    nonce, issued_at = next(iter(shard.nonces.items()))
+                    if issued_at >= cutoff:
+                        return removed + batch
+                    shard.nonces.popitem(last=False)
+                    batch += 1
+                removed += batch
+                if not shard.nonces:
+                    return removed
+            finally:
+                shard.release()
+
+    def expire(self, cutoff: float) -> int:
+        return sum(self._expire_shard(shard, cutoff) for shard in self.shards)
+
+    def sweep_step(self, cutoff: float) -> int:
+        shard = self.shards[self._next_sweep_shard]
+        self._next_sweep_shard = (self._next_sweep_shard + 1) % self.num_shards
+        return self._expire_shard(shard, cutoff)
+
+    def sweep_steps(self) -> int:
+        return self.num_shards
+
+    def live_count(self) -> int:
+        return sum(len(shard.nonces) for shard in self.shards)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        shard_sizes = [len(shard.nonces) for shard in self.shards]
+        acquisitions = sum(shard.acquisitions for shard in self.shards)
+        contended = sum(shard.contended for shard in self.shards)
+        wait_seconds = sum(shard.wait_seconds for shard in self.shards)
+
+        return {
+            "backend": "memory",
+            "num_shards": self.num_shards,
+            "live_nonces": sum(shard_sizes),
+            "shard_sizes": shard_sizes,
+            "max_shard_size": max(shard_sizes) if shard_sizes else 0,
+            "lock_acquisitions": acquisitions,
+            "contended_acquisitions": contended,
+            "contention_ratio": contended / acquisitions if acquisitions else 0.0,
+            "total_lock_wait_ms": wait_seconds * 1000,
+            "avg_contended_wait_ms": wait_seconds / contended * 1000 if contended else 0.0,
+            "max_lock_wait_ms": max(shard.max_wait_seconds for shard in self.shards) * 1000
+        }
+
+
+class SQLiteNonceStore(NonceStore):
+    """
+    Nonce table in a SQLite database in WAL mode, shared by every worker
+    process on the host. Consumption is a single DELETE, so exactly one
+    process can win a given nonce.
+    """
+
+    def __init__(self, db_path: str = "nonces.db", sweep_batch_size: int = 256, busy_timeout_ms: int = 5000):
+        self.db_path = db_path
+        self.sweep_batch_size = sweep_batch_size
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.operations = 0
+        self.busy_errors = 0
+        self.op_seconds = 0.0
+        self.max_op_seconds = 0.0
+        self._init_db()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections are not shareable across threads - keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        conn = self._connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS nonces (
+                nonce TEXT PRIMARY KEY,
+                issued_at REAL NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_nonces_issued_at ON nonces(issued_at)")
+
+    def _execute(self, sql: str, params: tuple) -> sqlite3.Cursor:
+        started = time.perf_counter()
+        try:
+            return self._connection().execute(sql, params)
+        except sqlite3.OperationalError as e:
+            if "locked" in str(e) or "busy" in str(e):
+                with self._stats_lock:
+                    self.busy_errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                self.operations += 1
+                self.op_seconds += elapsed
+                self.max_op_seconds = max(self.max_op_seconds, elapsed)
+
+    def add(self, nonce: str, issued_at: float):
+        self._execute("INSERT INTO nonces (nonce, issued_at) VALUES (?, ?)", (nonce, issued_at))
+
+    def consume(self, nonce: str, not_before: float) -> bool:
+        # An expired nonce is left for the sweeper - it can never satisfy not_before again
+        cursor = self._execute(
+            "DELETE FROM nonces WHERE nonce = ? AND issued_at >= ?", (nonce, not_before)
+        )
+        return cursor.rowcount == 1
+
+    def expire(self, cutoff: float) -> int:
+        removed = 0
+        while True:
+            step = self.sweep_step(cutoff)
+            removed += step
+            if step < self.sweep_batch_size:
+                return removed
+
+    def sweep_step(self, cutoff: float) -> int:
+        cursor = self._execute('''
+            DELETE FROM nonces WHERE nonce IN (
+                SELECT nonce FROM nonces WHERE issued_at < ? ORDER BY issued_at LIMIT ?
+            )
+        ''', (cutoff, self.sweep_batch_size))
+        return cursor.rowcount
+
+    def live_count(self) -> int:
+        return self._execute("SELECT COUNT(*) FROM nonces", ()).fetchone()[0]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        live_nonces = self.live_count()
+        with self._stats_lock:
+            return {
+                "backend": "sqlite",
+                "db_path": self.db_path,
+                "live_nonces": live_nonces,
+                "operations": self.operations,
+                "busy_errors": self.busy_errors,
+                "avg_op_ms": self.op_seconds / self.operations * 1000 if self.operations else 0.0,
+                "max_op_ms": self.max_op_seconds * 1000
+            }
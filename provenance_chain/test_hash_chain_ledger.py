@@ -0,0 +1,396 @@
+"""
+Tests for the hash chain ledger storage backends
+"""
+import json
+import os
+import tempfile
+
+from provenance_chain.hash_chain_ledger import HashChainLedger
+
+
+def _signed_event(trace_id: str, n: int):
+    return {
+        "event": {"trace_id": trace_id, "event_name": "test_event", "n": n},
+        "signature": "sig",
+        "key_id": "test-key"
+    }
+
+
+def test_segmented_append_and_rollover():
+    """Appends roll over into new segments and the chain stays valid"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = HashChainLedger(
+            ledger_file=os.path.join(tmp, "ledger.json"),
+            storage_dir=os.path.join(tmp, "segments"),
+            backend="segmented",
+            segment_size=4
+        )
+        indices = [ledger.append_event(_signed_event("t1", i)) for i in range(10)]
+
+        assert indices == list(range(1, 11))
+        assert ledger.get_chain_length() == 11
+        assert len([f for f in os.listdir(os.path.join(tmp, "segments")) if f.startswith("segment_")]) == 3
+        assert ledger.get_entry(7)["signed_event"]["event"]["n"] == 6
+        assert ledger.get_entry(11) is None
+        assert ledger.verify_chain_integrity()
+
+
+def test_segmented_reopen_recovers_tail_and_torn_write():
+    """Reopening restores the tail hash and drops a partially written record"""
+    with tempfile.TemporaryDirectory() as tmp:
+        kwargs = {
+            "ledger_file": os.path.join(tmp, "ledger.json"),
+            "storage_dir": os.path.join(tmp, "segments"),
+            "backend": "segmented",
+            "segment_size": 4
+        }
+        ledger = HashChainLedger(**kwargs)
+        for i in range(5):
+            ledger.append_event(_signed_event("t1", i))
+
+        with open(os.path.join(tmp, "segments", "segment_00000001.jsonl"), "ab") as f:
+            f.write(b'{"index": 6, "trunc')
+
+        reopened = HashChainLedger(**kwargs)
+        assert reopened.get_chain_length() == 6
+        assert reopened.append_event(_signed_event("t2", 0)) == 6
+        assert reopened.get_entry(6)["prev_hash"] == reopened.get_entry(5)["event_hash"]
+        assert reopened.verify_chain_integrity()
+
+
+def test_json_export_import_roundtrip():
+    """A legacy JSON ledger migrates into segments and exports back unchanged"""
+    with tempfile.TemporaryDirectory() as tmp:
+        json_ledger = HashChainLedger(ledger_file=os.path.join(tmp, "legacy.json"), backend="json")
+        for i in range(3):
+            json_ledger.append_event(_signed_event("t1", i))
+
+        migrated = HashChainLedger(
+            ledger_file=os.path.join(tmp, "legacy.json"),
+            storage_dir=os.path.join(tmp, "segments"),
+            backend="segmented"
+        )
+        assert migrated.get_chain_length() == 4
+        assert migrated.verify_chain_integrity()
+
+        export_path = migrated.export_json(os.path.join(tmp, "export.json"))
+        with open(export_path) as f, open(os.path.join(tmp, "legacy.json")) as g:
+            assert json.load(f) == json.load(g)
+
+        fresh = HashChainLedger(
+            ledger_file=os.path.join(tmp, "missing.json"),
+            storage_dir=os.path.join(tmp, "fresh"),
+            backend="segmented"
+        )
+        assert fresh.import_json(export_path) == 3
+        assert fresh.get_chain_length() == 4
+        assert fresh.verify_chain_integrity()
+
+        # A tampered export is rejected before anything is written
+        with open(export_path) as f:
+            entries = json.load(f)
+        entries[2]["signed_event"]["event"]["n"] = 99
+        tampered_path = os.path.join(tmp, "tampered.json")
+        with open(tampered_path, "w") as f:
+            json.dump(entries, f)
+        target = HashChainLedger(
+            ledger_file=os.path.join(tmp, "missing.json"),
+            storage_dir=os.path.join(tmp, "target"),
+            backend="segmented"
+        )
+        try:
+            target.import_json(tampered_path)
+        except ValueError as e:
+            assert "index 2" in str(e)
+        else:
+            raise AssertionError("tampered import was accepted")
+        assert target.get_chain_length() == 1
+
+        # A tampered legacy ledger is not migrated either
+        try:
+            HashChainLedger(
+                ledger_file=tampered_path,
+                storage_dir=os.path.join(tmp, "tampered_segments"),
+                backend="segmented"
+            )
+        except ValueError as e:
+            assert "index 2" in str(e)
+        else:
+            raise AssertionError("tampered legacy ledger was migrated")
+        assert not any(name.startswith("segment_") for name in os.listdir(os.path.join(tmp, "tampered_segments")))
+
+
+def test_trace_index_lookup_and_rebuild():
+    """Trace lookups use the index and survive a restart with a torn sidecar"""
+    with tempfile.TemporaryDirectory() as tmp:
+        kwargs = {
+            "ledger_file": os.path.join(tmp, "ledger.json"),
+            "storage_dir": os.path.join(tmp, "segments"),
+            "backend": "segmented",
+            "segment_size": 3
+        }
+        ledger = HashChainLedger(**kwargs)
+        for i in range(8):
+            ledger.append_event(_signed_event("even" if i % 2 == 0 else "odd", i))
+
+        assert [e["signed_event"]["event"]["n"] for e in ledger.get_trace_entries("odd")] == [1, 3, 5, 7]
+        assert ledger.get_trace_entries("missing") == []
+
+        # Drop the last posting and leave a torn line; restart must re-index the tail
+        index_file = os.path.join(tmp, "segments", "trace_index.jsonl")
+        with open(index_file) as f:
+            lines = f.readlines()
+        with open(index_file, "w") as f:
+            f.writelines(lines[:-1])
+            f.write('["odd", 9')
+
+        reopened = HashChainLedger(**kwargs)
+        assert [e["index"] for e in reopened.get_trace_entries("odd")] == [2, 4, 6, 8]
+        assert [e["index"] for e in reopened.get_trace_entries("even")] == [1, 3, 5, 7]
+
+
+def test_trace_lookup_sees_events_logged_by_another_instance():
+    """A trace lookup includes events another instance on the same store logged since"""
+    with tempfile.TemporaryDirectory() as tmp:
+        kwargs = {
+            "ledger_file": os.path.join(tmp, "ledger.json"),
+            "storage_dir": os.path.join(tmp, "segments"),
+            "backend": "segmented"
+        }
+        first = HashChainLedger(**kwargs)
+        second = HashChainLedger(**kwargs)
+        first.append_event(_signed_event("shared", 0))
+        assert [e["signed_event"]["event"]["n"] for e in second.get_trace_entries("shared")] == [0]
+
+        second.append_event(_signed_event("shared", 1))
+        first.append_event(_signed_event("other", 0))
+        first.append_event(_signed_event("shared", 2))
+        for ledger in (first, second):
+            assert [e["index"] for e in ledger.get_trace_entries("shared")] == [1, 2, 4]
+            assert [e["index"] for e in ledger.get_trace_entries("other")] == [3]
+
+
+def test_incremental_verification_resumes_from_checkpoint():
+    """Verification only re-hashes entries past the checkpoint; full mode catches older tampering"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = HashChainLedger(
+            ledger_file=os.path.join(tmp, "ledger.json"),
+            storage_dir=os.path.join(tmp, "segments"),
+            backend="segmented",
+            segment_size=4
+        )
+        for i in range(6):
+            ledger.append_event(_signed_event("t1", i))
+
+        first = ledger.verify_chain()
+        assert first["chain_valid"] and not first["resumed_from_checkpoint"]
+        assert first["entries_verified"] == 6
+
+        for i in range(3):
+            ledger.append_event(_signed_event("t1", 10 + i))
+        second = ledger.verify_chain()
+        assert second["chain_valid"] and second["resumed_from_checkpoint"]
+        assert second["verified_from"] == 6 and second["entries_verified"] == 3
+
+        # Tamper with an already-checkpointed entry's payload
+        path = os.path.join(tmp, "segments", "segment_00000000.jsonl")
+        with open(path) as f:
+            lines = f.readlines()
+        lines[2] = lines[2].replace('"n":1', '"n":99')
+        with open(path, "w") as f:
+            f.writelines(lines)
+
+        assert ledger.verify_chain_integrity()
+        report = ledger.verify_chain(full=True)
+        assert not report["chain_valid"]
+        assert report["first_invalid_index"] == 2
+
+
+def test_merkle_proofs_verify_and_survive_restart():
+    """Inclusion and consistency proofs verify, and the accumulator reloads from its sidecar"""
+    from provenance_chain.merkle_accumulator import MerkleAccumulator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kwargs = {
+            "ledger_file": os.path.join(tmp, "ledger.json"),
+            "storage_dir": os.path.join(tmp, "segments"),
+            "backend": "segmented"
+        }
+        ledger = HashChainLedger(**kwargs)
+        for i in range(12):
+            ledger.append_event(_signed_event("t1", i))
+        old_root = ledger.get_merkle_root()
+
+        # An explicit size of 0 means the empty tree, not "the whole chain"
+        assert ledger.get_merkle_root(0)["tree_size"] == 0
+        assert ledger.get_merkle_root(0)["root"] != old_root["root"]
+        try:
+            ledger.get_inclusion_proof(0, tree_size=0)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("inclusion proof against an empty tree was accepted")
+
+        proof = ledger.get_inclusion_proof(5)
+        assert len(proof["audit_path"]) <= 4
+        assert MerkleAccumulator.verify_inclusion(
+            bytes.fromhex(proof["leaf_hash"]), 5, proof["tree_size"],
+            [bytes.fromhex(p) for p in proof["audit_path"]], bytes.fromhex(proof["root"])
+        )
+
+        reopened = HashChainLedger(**kwargs)
+        assert reopened.get_merkle_root() == old_root
+        for i in range(7):
+            reopened.append_event(_signed_event("t2", i))
+
+        consistency = reopened.get_consistency_proof(old_root["tree_size"])
+        assert consistency["first_root"] == old_root["root"]
+        assert MerkleAccumulator.verify_consistency(
+            consistency["first_size"], consistency["second_size"],
+            bytes.fromhex(consistency["first_root"]), bytes.fromhex(consistency["second_root"]),
+            [bytes.fromhex(p) for p in consistency["proof"]]
+        )
+
+
+def test_group_commit_assigns_unique_indices_under_concurrency():
+    """Concurrent appenders each get their own index and batches share one fsync"""
+    import threading
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = HashChainLedger(
+            ledger_file=os.path.join(tmp, "ledger.json"),
+            storage_dir=os.path.join(tmp, "segments"),
+            backend="segmented",
+            segment_size=16,
+            group_commit=True,
+            max_batch_size=32,
+            max_batch_wait_ms=5
+        )
+        results = []
+        lock = threading.Lock()
+
+        def worker(worker_id):
+            for i in range(25):
+                index = ledger.append_event(_signed_event(f"w{worker_id}", i))
+                with lock:
+                    results.append(index)
+
+        threads = [threading.Thread(target=worker, args=(w,)) for w in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(results) == list(range(1, 201))
+        assert ledger.verify_chain(full=True)["chain_valid"]
+        assert len(ledger.get_trace_entries("w3")) == 25
+
+        stats = ledger.get_commit_stats()
+        assert stats["entries_committed"] == 200
+        assert stats["batches_committed"] < 200
+
+
+def test_writers_sharing_a_store_extend_one_chain():
+    """Separate ledger instances on one directory (as in separate worker processes) never fork the chain"""
+    import threading
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kwargs = {
+            "ledger_file": os.path.join(tmp, "ledger.json"),
+            "storage_dir": os.path.join(tmp, "segments"),
+            "backend": "segmented",
+            "segment_size": 8
+        }
+        first = HashChainLedger(**kwargs)
+        second = HashChainLedger(**kwargs)
+
+        # Each writer chains from the tail the other one wrote
+        assert first.append_event(_signed_event("a", 0)) == 1
+        assert second.append_event(_signed_event("b", 0)) == 2
+        assert first.append_event(_signed_event("a", 1)) == 3
+        assert first.get_entry(3)["prev_hash"] == second.get_entry(2)["event_hash"]
+
+        def worker(ledger, trace_id):
+            for i in range(30):
+                ledger.append_event(_signed_event(trace_id, i))
+
+        threads = [threading.Thread(target=worker, args=(ledger, trace_id))
+                   for ledger, trace_id in ((first, "w1"), (second, "w2"))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        reopened = HashChainLedger(**kwargs)
+        assert reopened.get_chain_length() == 64
+        assert reopened.verify_chain(full=True)["chain_valid"]
+        assert len(reopened.get_trace_entries("w1")) == 30
+        assert len(reopened.get_trace_entries("w2")) == 30
+
+        # A writer's indexes and Merkle tree include the other writer's entries once it catches up
+        first.append_event(_signed_event("a", 2))
+        assert len(first.get_trace_entries("w2")) == 30
+        assert first.get_merkle_root()["root"] == HashChainLedger(**kwargs).get_merkle_root()["root"]
+
+
+def test_reader_sees_entries_another_instance_appended():
+    """A ledger instance that only reads serves entries written through another instance"""
+    from provenance_chain.merkle_accumulator import MerkleAccumulator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kwargs = {
+            "ledger_file": os.path.join(tmp, "ledger.json"),
+            "storage_dir": os.path.join(tmp, "segments"),
+            "backend": "segmented",
+            "segment_size": 4
+        }
+        writer = HashChainLedger(**kwargs)
+        reader = HashChainLedger(**kwargs)
+        assert reader.get_chain_length() == 1
+
+        for i in range(6):
+            writer.append_event(_signed_event("w", i))
+
+        assert reader.get_chain_length() == 7
+        assert reader.get_entry(6) == writer.get_entry(6)
+        assert [e["index"] for e in reader.iter_entries(5)] == [5, 6]
+        assert len(reader.get_all_entries()) == 7
+
+        report = reader.verify_chain(full=True)
+        assert report["chain_valid"] and report["entries_verified"] == 6
+
+        root = reader.get_merkle_root()
+        assert root == writer.get_merkle_root() and root["tree_size"] == 7
+        proof = reader.get_inclusion_proof(6)
+        assert MerkleAccumulator.verify_inclusion(
+            bytes.fromhex(proof["leaf_hash"]), 6, 7,
+            [bytes.fromhex(node) for node in proof["audit_path"]], bytes.fromhex(root["root"])
+        )
+        assert reader.get_consistency_proof(1)["second_size"] == 7
+
+
+def test_per_append_commit_stats_under_concurrency():
+    """Per-append mode counts every commit when many threads append at once"""
+    import threading
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = HashChainLedger(
+            ledger_file=os.path.join(tmp, "ledger.json"),
+            storage_dir=os.path.join(tmp, "segments"),
+            backend="segmented"
+        )
+
+        def worker(worker_id):
+            for i in range(50):
+                ledger.append_event(_signed_event(f"w{worker_id}", i))
+                ledger.get_commit_stats()
+
+        threads = [threading.Thread(target=worker, args=(w,)) for w in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = ledger.get_commit_stats()
+        assert stats["mode"] == "per_append"
+        assert stats["entries_committed"] == stats["batches_committed"] == 300
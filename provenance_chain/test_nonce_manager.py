@@ -0,0 +1,69 @@
+"""
+Tests for the anti-replay nonce manager
+"""
+import time
+
+from provenance_chain.nonce_manager import NonceManager
+
+
+def test_nonce_is_single_use():
+    """A generated nonce validates once and is rejected on replay"""
+    manager = NonceManager()
+    nonce = manager.generate_nonce()
+
+    assert manager.validate_nonce(nonce)
+    assert not manager.validate_nonce(nonce)
+    assert not manager.validate_nonce("never-issued")
+
+
+def test_expired_nonces_are_rejected_and_swept():
+    """Nonces past the TTL fail validation and are removed oldest-first"""
+    manager = NonceManager(ttl_seconds=600, num_shards=4)
+    old = [manager.generate_nonce() for _ in range(3)]
+    for nonce in old:
+        manager.store._shard_for(nonce).nonces[nonce] -= 1200
+    fresh = manager.generate_nonce()
+
+    assert not manager.validate_nonce(old[0])
+    assert manager.expire_nonces() == 2
+    assert manager.live_count() == 1
+    assert manager.validate_nonce(fresh)
+
+
+def test_contention_metrics_track_shards():
+    """Metrics report per-shard sizes and lock acquisitions"""
+    manager = NonceManager(num_shards=8)
+    nonces = [manager.generate_nonce() for _ in range(100)]
+    manager.validate_nonce(nonces[0])
+
+    metrics = manager.get_contention_metrics()
+    assert metrics["num_shards"] == 8
+    assert metrics["live_nonces"] == 99
+    assert sum(metrics["shard_sizes"]) == 99
+    assert metrics["lock_acquisitions"] == 101
+
+
+def _consume_in_worker(db_path, nonce):
+    return NonceManager(backend="sqlite", db_path=db_path).validate_nonce(nonce)
+
+
+def test_sqlite_backend_shares_nonces_across_processes():
+    """A nonce issued by one process is accepted exactly once across all workers"""
+    import multiprocessing
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "nonces.db")
+        issuer = NonceManager(backend="sqlite", db_path=db_path)
+        nonce = issuer.generate_nonce()
+
+        with multiprocessing.get_context("fork").Pool(4) as pool:
+            results = pool.starmap(_consume_in_worker, [(db_path, nonce)] * 8)
+
+        assert results.count(True) == 1
+        assert not issuer.validate_nonce(nonce)
+
+        expired = issuer.generate_nonce()
+        assert issuer.expire_nonces(time.time() + issuer.ttl_seconds + 1) == 1
+        assert not NonceManager(backend="sqlite", db_path=db_path).validate_nonce(expired)
@@ -0,0 +1,117 @@
+import json
+import os
+from typing import Dict, Any, List, Optional, Tuple
+from .ledger_storage import LedgerStorage, Location
+
+# (ledger index, location of the record in storage)
+IndexEntry = Tuple[int, Optional[Location]]
+
+
+class TraceIndex:
+    """
+    Secondary index from trace_id to ledger positions.
+
+    Postings are appended to a sidecar JSONL file alongside the ledger so a
+    restart only has to replay entries written after the last indexed one.
+    The sidecar is derived data: a torn or missing file is simply rebuilt
+    from the ledger.
+    """
+
+    def __init__(self, index_file: Optional[str] = None):
+        self.index_file = index_file
+        self.postings: Dict[str, List[IndexEntry]] = {}
+        self.last_indexed = -1
+        # Bytes of the sidecar already loaded into postings
+        self.sidecar_offset = 0
+
+    @staticmethod
+    def extract_trace_id(entry: Dict[str, Any]) -> Optional[str]:
+        """Return the trace_id carried by a ledger entry, if any."""
+        signed_event = entry.get('signed_event')
+        if not signed_event:
+            return None
+        return signed_event.get('event', {}).get('trace_id')
+
+    def rebuild(self, storage: LedgerStorage):
+        """Load the persisted index and catch up on any entries it is missing."""
+        self.postings = {}
+        self.last_indexed = -1
+        self.sidecar_offset = 0
+        self._load_sidecar()
+
+        if self.last_indexed >= storage.length():
+            # Sidecar is ahead of the ledger (ledger was reset) - start over
+            self.postings = {}
+            self.last_indexed = -1
+            self.sidecar_offset = 0
+            if self.index_file and os.path.exists(self.index_file):
+                os.remove(self.index_file)
+
+        self._index_from(storage)
+
+    def catch_up(self, storage: LedgerStorage):
+        """Load postings other writers appended to the sidecar, then index any entries still missing."""
+        self._load_sidecar()
+        self._index_from(storage)
+
+    def _index_from(self, storage: LedgerStorage):
+        batch = []
+        for item in storage.iter_located(self.last_indexed + 1):
+            batch.append(item)
+            if len(batch) >= 1000:
+                self.add_batch(batch)
+                batch = []
+        self.add_batch(batch)
+
+    def _load_sidecar(self):
+        """Load postings written since sidecar_offset, dropping a torn trailing line."""
+        if not self.index_file or not os.path.exists(self.index_file):
+            return
+
+        with open(self.index_file, 'rb') as f:
+            f.seek(self.sidecar_offset)
+            data = f.read()
+
+        valid_bytes = 0
+        for line in data.splitlines(keepends=True):
+            try:
+                trace_id, index, location = json.loads(line)
+            except ValueError:
+                break
+            if not line.endswith(b'\n'):
+                break
+            self.postings.setdefault(trace_id, []).append(
+                (index, tuple(location) if location is not None else None)
+            )
+            self.last_indexed = max(self.last_indexed, index)
+            valid_bytes += len(line)
+
+        self.sidecar_offset += valid_bytes
+        if valid_bytes != len(data):
+            with open(self.index_file, 'r+b') as f:
+                f.truncate(self.sidecar_offset)
+
+    def add(self, index: int, entry: Dict[str, Any], location: Optional[Location] = None):
+        """Index a newly appended ledger entry."""
+        self.add_batch([(index, entry, location)])
+
+    def add_batch(self, items: List[Tuple[int, Dict[str, Any], Optional[Location]]]):
+        """Index several appended entries, writing their postings in one go."""
+        lines = []
+        for index, entry, location in items:
+            self.last_indexed = max(self.last_indexed, index)
+            trace_id = self.extract_trace_id(entry)
+            if trace_id is None:
+                continue
+            self.postings.setdefault(trace_id, []).append((index, location))
+            lines.append(json.dumps([trace_id, index, location], separators=(',', ':')) + '\n')
+
+        if self.index_file and lines:
+            data = ''.join(lines).encode()
+            with open(self.index_file, 'ab') as f:
+                f.write(data)
+            self.sidecar_offset += len(data)
+
+    def lookup(self, trace_id: str) -> List[IndexEntry]:
+        """Return the (index, location) postings for a trace in chain order."""
+        return list(self.postings.get(trace_id, []))
@@ -0,0 +1,57 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, Any, Optional
+from .event_signer import signer
+
+
+class CheckpointStore:
+    """
+    Signed verification checkpoints for the hash chain ledger.
+
+    A checkpoint records "verified up to index N with tail hash H" and is
+    HMAC-signed with the event signer, so an attacker who rewrites the
+    ledger cannot also forge the point verification resumes from.
+    Checkpoints are appended to a JSONL file; the latest valid one wins.
+    """
+
+    def __init__(self, checkpoint_file: Optional[str] = None):
+        self.checkpoint_file = checkpoint_file
+        self.latest: Optional[Dict[str, Any]] = None
+        self._load()
+
+    def _load(self):
+        if not self.checkpoint_file or not os.path.exists(self.checkpoint_file):
+            return
+
+        with open(self.checkpoint_file, 'r') as f:
+            for line in f:
+                try:
+                    checkpoint = json.loads(line)
+                except ValueError:
+                    continue
+                if signer.verify_signature(checkpoint):
+                    self.latest = checkpoint
+
+    def get_latest(self) -> Optional[Dict[str, Any]]:
+        """Return the latest checkpoint payload with a valid signature."""
+        if self.latest is None:
+            return None
+        return self.latest['event']
+
+    def record(self, verified_index: int, tail_hash: str) -> Dict[str, Any]:
+        """Sign and persist a new checkpoint."""
+        signed_checkpoint = signer.sign_event({
+            "verified_index": verified_index,
+            "tail_hash": tail_hash,
+            "timestamp": datetime.utcnow().isoformat() + 'Z'
+        })
+
+        if self.checkpoint_file:
+            with open(self.checkpoint_file, 'a') as f:
+                f.write(json.dumps(signed_checkpoint, sort_keys=True, separators=(',', ':')) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+        self.latest = signed_checkpoint
+        return signed_checkpoint['event']
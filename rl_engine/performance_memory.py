@@ -237,6 +237,45 @@ class PerformanceMemory:
             "recent_trend": trend
         }
     
+    def get_reward_aggregates(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Get reward totals grouped by agent and by jurisdiction in one pass.
+        
+        Returns:
+            {"agents": {agent_id: {"count", "total_reward"}},
+             "jurisdictions": {jurisdiction: {"count", "total_reward"}}}
+        """
+        if self.use_sqlite:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT agent_id, jurisdiction, COUNT(*), SUM(reward_score)
+                FROM performance_records
+                GROUP BY agent_id, jurisdiction
+            ''')
+            rows = cursor.fetchall()
+            conn.close()
+        else:
+            grouped = {}
+            for trace_records in self._load_json_data().values():
+                for record in trace_records:
+                    key = (record.get("agent_id"), record.get("jurisdiction"))
+                    count, total = grouped.get(key, (0, 0.0))
+                    grouped[key] = (count + 1, total + record["reward_score"])
+            rows = [(agent_id, jurisdiction, count, total)
+                    for (agent_id, jurisdiction), (count, total) in grouped.items()]
+        
+        aggregates = {"agents": {}, "jurisdictions": {}}
+        for agent_id, jurisdiction, count, total in rows:
+            for group, key in (("agents", agent_id), ("jurisdictions", jurisdiction)):
+                if key is None:
+                    continue
+                entry = aggregates[group].setdefault(key, {"count": 0, "total_reward": 0.0})
+                entry["count"] += count
+                entry["total_reward"] += total
+        
+        return aggregates
+    
     def adjust_confidence_based_on_performance(self, agent_id: str, base_confidence: float) -> float:
         """
         Adjust confidence score based on agent's performance history.
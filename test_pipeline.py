@@ -4,6 +4,9 @@ Test script to verify the jurisdiction routing pipeline and RL engine components
 """
 
 import asyncio
+import os
+import tempfile
+import time
 from jurisdiction_router.router import JurisdictionRouter
 from jurisdiction_router.resolver_pipeline import ResolverPipeline
 from jurisdiction_router.confidence_aggregator import ConfidenceAggregator
@@ -42,6 +45,236 @@ async def test_jurisdiction_routing():
         print(f"  Confidence: {result['confidence']:.2f}")
         print(f"  Fallback used: {result.get('fallback_used', False)}")
 
+def test_router_pattern_matching():
+    """Test that compiled pattern matching scores each pattern once and picks up new patterns."""
+    print("\n\nTesting Jurisdiction Router pattern matching...")
+    
+    router = JurisdictionRouter()
+    
+    # "indian" and "indian parliament" belong to different patterns and both count
+    assert router.route_query("Bill passed by the Indian Parliament") == ("IN", 1.0)
+    # Ties go to the first jurisdiction in pattern order
+    assert router.route_query("Is a Dubai contract valid in London?") == ("UK", 0.5)
+    assert router.route_query("Tell me about judicial review in the United States") == ("IN", 0.1)
+    # Whole words only
+    assert router.route_query("indianapolis zoning") == ("IN", 0.1)
+    
+    router.add_jurisdiction_pattern("UK", r"\b(bailii|uksc)\b", 3.0)
+    router.add_jurisdiction_pattern("IN", r"section\s+\d+\s+ipc")
+    assert router.route_query("UKSC judgment on section 302 IPC")[0] == "UK"
+    assert router.route_query("charged under section 302 ipc")[0] == "IN"
+    
+    # Patterns edited in place take effect once recompiled
+    router.jurisdiction_patterns["UAE"][2] = r"\b(federal national council|difc)\b"
+    router.recompile()
+    assert router.route_query("DIFC courts ruling") == ("UAE", 1.0)
+    print("Pattern matching checks passed")
+
+def test_router_batch():
+    """Test that route_batch agrees with route_query for every query."""
+    print("\n\nTesting Jurisdiction Router batch routing...")
+    
+    router = JurisdictionRouter()
+    router.add_jurisdiction_pattern("UK", r"\b(court of appeal)\b", 0.5)
+    queries = [
+        "What are the fundamental rights in the Indian Constitution?",
+        "Court of Appeal ruling in London",
+        "Is a Dubai contract valid in London?",
+        "Tell me about judicial review in the United States",
+        "Court of Appeal ruling in London",
+        ""
+    ]
+    labels, confidences = router.route_batch(queries)
+    assert len(labels) == len(confidences) == len(queries)
+    for query, label, confidence in zip(queries, labels, confidences):
+        expected_label, expected_confidence = router.route_query(query)
+        assert label == expected_label
+        assert abs(confidence - expected_confidence) < 1e-9
+    print(f"Batch routed {len(queries)} queries: {list(labels)}")
+
+class _CountingAgent:
+    """Agent stand-in that counts how often it is called."""
+    
+    def __init__(self):
+        self.calls = 0
+        self.events = []
+    
+    async def process(self, query):
+        self.calls += 1
+        return {"confidence": 0.7, "articles": []}
+    
+    def emit_event(self, event_name, details=None):
+        self.events.append((event_name, details))
+        return {}
+
+async def test_resolver_result_cache():
+    """Test that repeated queries are served from the resolver cache until invalidated."""
+    print("\n\nTesting resolver result cache...")
+    
+    resolver = ResolverPipeline(cache_size=2)
+    agent = _CountingAgent()
+    resolver.register_agent("UK", "legal", agent)
+    
+    first = await resolver.resolve_and_dispatch("UK", "Contract dispute", "trace-1")
+    first["response"]["articles"].append("mutated by caller")
+    second = await resolver.resolve_and_dispatch("UK", "  contract DISPUTE ", "trace-2")
+    assert agent.calls == 1
+    assert [details["source"] for _, details in agent.events] == ["agent", "cache"]
+    assert second["trace_id"] == "trace-2" and first["trace_id"] == "trace-1"
+    assert second["response"]["articles"] == []
+    
+    # Different jurisdiction or agent type is a different entry
+    await resolver.resolve_and_dispatch("UAE", "Contract dispute")
+    await resolver.resolve_and_dispatch("UK", "Constitution of the UK")
+    metrics = resolver.get_cache_metrics()
+    assert metrics["hits"] == 1 and metrics["misses"] == 3 and metrics["evictions"] == 1
+    
+    # The least recently used entry (UK contract dispute) was evicted
+    await resolver.resolve_and_dispatch("UK", "Contract dispute")
+    assert agent.calls == 2
+    
+    resolver.register_agent("UK", "legal", _CountingAgent())
+    assert resolver.get_cache_metrics()["size"] == 0
+    await resolver.resolve_and_dispatch("UK", "Contract dispute")
+    resolver.notify_corpus_changed()
+    assert resolver.get_cache_metrics()["size"] == 0
+    print(f"Resolver cache metrics: {resolver.get_cache_metrics()}")
+
+class _SlowAgent(_CountingAgent):
+    """Counting agent that takes a while to answer."""
+    
+    async def process(self, query):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return {"confidence": 0.6}
+
+async def test_resolver_coalescing():
+    """Test that concurrent identical queries share one agent call with separate trace IDs."""
+    print("\n\nTesting resolver request coalescing...")
+    
+    resolver = ResolverPipeline(cache_size=0)
+    agent = _SlowAgent()
+    resolver.register_agent("UK", "legal", agent)
+    
+    results = await asyncio.gather(*[
+        resolver.resolve_and_dispatch("UK", "Tenancy deposit rules", f"trace-{i}")
+        for i in range(20)
+    ])
+    assert agent.calls == 1
+    assert [result["trace_id"] for result in results] == [f"trace-{i}" for i in range(20)]
+    assert all(result["confidence"] == 0.6 for result in results)
+    assert resolver.get_cache_metrics()["coalesced"] == 19
+    assert resolver.get_cache_metrics()["in_flight"] == 0
+    
+    # Each caller still logs a classification event for its own trace
+    sources = {details["trace_id"]: details["source"] for _, details in agent.events}
+    assert sources == {f"trace-{i}": "agent" if i == 0 else "coalesced" for i in range(20)}
+    
+    # Nothing is cached: a later request runs the agent again
+    await resolver.resolve_and_dispatch("UK", "Tenancy deposit rules")
+    assert agent.calls == 2
+    
+    # A cancelled caller does not cancel the shared computation for the others
+    first = asyncio.ensure_future(resolver.resolve_and_dispatch("UK", "Eviction notice", "a"))
+    second = asyncio.ensure_future(resolver.resolve_and_dispatch("UK", "Eviction notice", "b"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert (await second)["trace_id"] == "b"
+    assert agent.calls == 3
+    print(f"Resolver coalescing metrics: {resolver.get_cache_metrics()}")
+
+class _TimedResolver:
+    """Resolver stand-in with a fixed latency and confidence (or error to raise) per jurisdiction."""
+    
+    def __init__(self, profile):
+        self.profile = profile
+        self.started = []
+        self.cancelled = []
+    
+    async def resolve_and_dispatch(self, jurisdiction, query, trace_id=None):
+        delay, confidence = self.profile[jurisdiction]
+        self.started.append(jurisdiction)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(jurisdiction)
+            raise
+        if isinstance(confidence, Exception):
+            raise confidence
+        return {"jurisdiction": jurisdiction, "confidence": confidence}
+
+async def test_hedged_fallback():
+    """Test that hedged fallback takes the first confident result and cancels the rest."""
+    print("\n\nTesting hedged fallback...")
+    
+    profile = {"IN": (0.3, 0.2), "UK": (0.05, 0.9), "UAE": (0.3, 0.95)}
+    
+    resolver = _TimedResolver(profile)
+    manager = FallbackManager(resolver, hedge_delay=0)
+    started = time.perf_counter()
+    result = await manager.process_with_fallback("IN", "query")
+    elapsed = time.perf_counter() - started
+    assert result["jurisdiction"] == "UK"
+    assert result["processing_path"] == ["IN", "UK"]
+    assert result["fallback_used"] and result["fallback_level"] == 1
+    assert sorted(resolver.cancelled) == ["IN", "UAE"]
+    assert elapsed < 0.25
+    
+    # With a hedge delay the fallback starts only after the primary has been slow
+    resolver = _TimedResolver({"IN": (0.01, 0.8), "UK": (0.01, 0.9), "UAE": (0.01, 0.9)})
+    result = await FallbackManager(resolver, hedge_delay=0.2).process_with_fallback("IN", "query")
+    assert result["processing_path"] == ["IN"] and not result["fallback_used"]
+    assert resolver.started == ["IN"]
+    
+    # Nothing confident: same shape as the sequential mode
+    low = {"IN": (0.01, 0.3), "UK": (0.02, 0.5), "UAE": (0.0, 0.4)}
+    hedged = await FallbackManager(_TimedResolver(low), hedge_delay=0.05).process_with_fallback("IN", "query")
+    serial = await FallbackManager(_TimedResolver(low)).process_with_fallback("IN", "query")
+    assert hedged == serial
+    assert hedged["jurisdiction"] == "UK" and hedged["fallback_level"] == 2
+    
+    # A failing fallback does not sink a primary that succeeds, as in the sequential mode
+    flaky = {"IN": (0.3, 0.9), "UK": (0.0, ValueError("fallback down UK")), "UAE": (0.0, ValueError("fallback down UAE"))}
+    hedged = await FallbackManager(_TimedResolver(flaky), hedge_delay=0.05).process_with_fallback("IN", "query")
+    serial = await FallbackManager(_TimedResolver(flaky)).process_with_fallback("IN", "query")
+    assert hedged == serial
+    assert hedged["jurisdiction"] == "IN" and not hedged["fallback_used"]
+    
+    # When every jurisdiction fails, the primary's error is raised
+    down = {"IN": (0.02, KeyError("IN")), "UK": (0.0, ValueError("UK")), "UAE": (0.0, ValueError("UAE"))}
+    try:
+        await FallbackManager(_TimedResolver(down), hedge_delay=0).process_with_fallback("IN", "query")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("expected the primary's KeyError")
+    print("Hedged fallback checks passed")
+
+async def test_adaptive_fallback_order():
+    """Test that fallback order follows cached reward aggregates from performance memory."""
+    print("\n\nTesting adaptive fallback ordering...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        memory = PerformanceMemory(db_path=os.path.join(tmp, "performance.db"))
+        for i in range(10):
+            memory.record_performance(f"t-uk-{i}", "LegalAgent_UK", "UK", -0.5, 0.6, 0.5)
+            memory.record_performance(f"t-uae-{i}", "LegalAgent_UAE", "UAE", 0.8, 0.6, 0.7)
+        # Constitutional queries use a different agent with the opposite history
+        for i in range(10):
+            memory.record_performance(f"t-c-{i}", "ConstitutionalAgent_UK", "UK", 0.9, 0.6, 0.8)
+        
+        manager = FallbackManager(ResolverPipeline(), performance_memory=memory)
+        # Until aggregates are loaded the static priorities apply
+        assert manager.get_fallback_order("IN", "contract dispute") == ["UK", "UAE"]
+        
+        await manager.process_with_fallback("IN", "contract dispute")
+        manager.refresh_reward_stats()
+        
+        assert manager.stats_refreshed_at is not None
+        assert manager.get_fallback_order("IN", "contract dispute") == ["UAE", "UK"]
+        assert manager.get_fallback_order("IN", "fundamental rights in the constitution") == ["UK", "UAE"]
+    print("Adaptive fallback ordering checks passed")
+
 async def test_rl_engine():
     """Test the RL reward engine."""
     print("\n\nTesting RL Reward Engine...")
@@ -114,6 +347,12 @@ def test_performance_memory():
 async def main():
     """Run all tests."""
     await test_jurisdiction_routing()
+    test_router_pattern_matching()
+    test_router_batch()
+    await test_resolver_result_cache()
+    await test_resolver_coalescing()
+    await test_hedged_fallback()
+    await test_adaptive_fallback_order()
     await test_rl_engine()
     test_performance_memory()
     print("\n\nAll tests completed successfully!")